@@ -0,0 +1,138 @@
+"""Benchmarks for the pattern engine.
+
+Run with: python benchmark.py
+"""
+import itertools
+import time
+import tracemalloc
+
+import pattern_engine
+import pattern_grid
+import pattern_stats
+import pattern_store
+
+
+def legacy_is_valid(permutation) -> bool:
+    """Original validity check that filtered every permutation."""
+    visited_dots = [permutation[0]]
+    for prev, last in enumerate(permutation[1:]):
+        prev = permutation[prev]
+        for a, b, c in zip("379179139137", "111333777999", "245256458568"):
+            if last == a and prev == b and c not in visited_dots:
+                return False
+        for d, e in zip("2846", "8264"):
+            if last == d and prev == e and "5" not in visited_dots:
+                return False
+        visited_dots.append(last)
+    return True
+
+
+def legacy_generate(min_length=4, max_length=9) -> list:
+    """Original generation: filters all permutations of each length."""
+    all_patterns = []
+    for dots_connected in range(min_length, max_length + 1):
+        for pattern in list(
+                itertools.permutations("123456789", dots_connected)):
+            if legacy_is_valid(pattern):
+                all_patterns.append(pattern)
+    return all_patterns
+
+
+def timed(function, *args):
+    """Returns function's result and time it took in seconds."""
+    timer = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - timer
+
+
+def bench_generation():
+    """Compares permutation filtering with backtracking enumeration."""
+    legacy, legacy_time = timed(legacy_generate)
+    engine, engine_time = timed(
+        lambda: list(pattern_engine.generate_patterns()))
+    assert legacy == engine, "Engine returned different patterns"
+    print(f"Generation of {len(engine)} patterns:")
+    print(f"  permutations + filter: {legacy_time:.3f} s")
+    print(f"  backtracking engine:   {engine_time:.3f} s "
+          f"({legacy_time / engine_time:.1f}x faster)")
+
+
+def bench_validation():
+    """Compares the original validity check with the batch validator."""
+    candidates = [p for n in range(4, 10)
+                  for p in itertools.permutations("123456789", n)]
+    legacy, legacy_time = timed(
+        lambda: bytearray(legacy_is_valid(p) for p in candidates))
+    batch, batch_time = timed(pattern_engine.validate_patterns, candidates)
+    assert legacy == batch, "Validator returned different results"
+    print(f"Validation of {len(candidates)} candidates:")
+    print(f"  original check:  {legacy_time:.3f} s")
+    print(f"  batch validator: {batch_time:.3f} s "
+          f"({legacy_time / batch_time:.1f}x faster)")
+
+
+def allocated(function):
+    """Returns function's result and memory it allocated in bytes."""
+    tracemalloc.start()
+    result = function()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def bench_memory():
+    """Compares a list of string tuples with the packed PatternStore."""
+    patterns, list_size = allocated(
+        lambda: list(pattern_engine.generate_patterns()))
+    store, store_size = allocated(
+        lambda: pattern_store.PatternStore(pattern_engine.generate_patterns()))
+    assert list(store) == patterns, "Store returned different patterns"
+    assert store[::-1][0] == patterns[-1] and len(store) == len(patterns)
+    print(f"Memory of {len(patterns)} patterns:")
+    print(f"  list of tuples: {list_size / 2 ** 20:.2f} MiB")
+    print(f"  PatternStore:   {store_size / 2 ** 20:.2f} MiB "
+          f"({list_size / store_size:.1f}x smaller)")
+
+
+def bench_statistics():
+    """Compares the pure Python pass with NumPy over all patterns."""
+    store = pattern_store.PatternStore(pattern_engine.generate_patterns())
+    python, python_time = timed(pattern_stats.python_metrics, store)
+    print(f"Statistics of {len(store)} patterns:")
+    print(f"  pure Python: {python_time:.3f} s")
+    if pattern_grid.load_numpy() is None:
+        print("  NumPy is not installed")
+        return
+    vectorized, numpy_time = timed(pattern_stats.numpy_metrics, store)
+    assert all(python[name] == vectorized[name] for name in
+               pattern_stats.METRICS if name != "length"), \
+        "NumPy returned different metrics"
+    print(f"  NumPy:       {numpy_time:.3f} s "
+          f"({python_time / numpy_time:.1f}x faster)")
+
+
+def bench_grid():
+    """Counts and streams patterns of a 4x4 grid."""
+    grid = pattern_grid.Grid(4, 4)
+    counts, python_time = timed(grid.python_counts, grid.size)
+    print(f"Counting {sum(counts[4:])} patterns of a 4x4 grid:")
+    print(f"  pure Python: {python_time:.3f} s")
+    if pattern_grid.load_numpy() is not None:
+        vectorized, numpy_time = timed(grid.numpy_counts, grid.size)
+        assert counts == vectorized, "NumPy returned different counts"
+        print(f"  NumPy:       {numpy_time:.3f} s "
+              f"({python_time / numpy_time:.1f}x faster)")
+    streamed, stream_time = timed(lambda: sum(
+        len(chunk) // length for length, _dot, chunk in
+        grid.iter_pattern_chunks(4, 6)))
+    assert streamed == sum(counts[4:7]), "Stream returned different patterns"
+    print(f"Streaming {streamed} patterns of 4 to 6 dots: "
+          f"{stream_time:.3f} s")
+
+
+if __name__ == '__main__':
+    bench_generation()
+    bench_validation()
+    bench_memory()
+    bench_statistics()
+    bench_grid()
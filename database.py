@@ -0,0 +1,323 @@
+"""Long-lived SQLite connection shared by the whole program
+and the repository of user's settings stored in it."""
+import collections
+import contextlib
+import sqlite3
+import threading
+import time
+
+
+class Database:
+
+    # Writes outside of a transaction are committed together at most
+    # this often (in seconds), instead of after every single query
+    commit_interval = 1.0
+
+    def __init__(self, path):
+        """Opens a connection that stays open until close() is called.
+
+        The database is switched to WAL mode, so commits are cheap appends,
+        and sqlite3 keeps compiled (prepared) statements of recent queries
+        (up to 128 by default, far more than this program uses).
+        """
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.lock = threading.RLock()
+        self.transactions = 0  # depth of nested transaction() blocks
+        self.last_commit = time.monotonic()
+        self.flush_timer = None  # commits writes that are still pending
+        self.closed = False
+
+        # Instrumentation, see statistics()
+        self.queries = 0
+        self.seconds = 0.0
+        self.measured_since = time.monotonic()
+
+    def query(self, sql, parameters=()) -> list:
+        """Runs a query and returns all rows."""
+        with self.lock:
+            timer = time.perf_counter()
+            rows = self.connection.execute(sql, parameters).fetchall()
+            self.measure(timer)
+            return rows
+
+    def execute(self, sql, parameters=()):
+        """Runs a query that changes the database."""
+        with self.lock:
+            timer = time.perf_counter()
+            self.connection.execute(sql, parameters)
+            self.measure(timer)
+            self.commit_later()
+
+    def executemany(self, sql, sequence_of_parameters):
+        """Runs a query that changes the database once for every parameters."""
+        with self.lock:
+            timer = time.perf_counter()
+            self.connection.executemany(sql, sequence_of_parameters)
+            self.measure(timer)
+            self.commit_later()
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Groups queries into one transaction.
+
+        Everything is committed when the outermost block ends, or rolled
+        back if it ends with an exception. Writes made before the block
+        are committed first, so a rollback never undoes them.
+        """
+        with self.lock:
+            if not self.transactions and self.connection.in_transaction:
+                self.commit()
+            self.transactions += 1
+            try:
+                yield self
+            except BaseException:
+                self.transactions -= 1
+                if not self.transactions:
+                    self.connection.rollback()
+                raise
+            self.transactions -= 1
+            if not self.transactions:
+                self.commit()
+
+    def commit_later(self):
+        """Commits pending changes if the last commit is old enough,
+        otherwise starts a timer that commits them when it is."""
+        if self.transactions:
+            return
+        wait = self.commit_interval - (time.monotonic() - self.last_commit)
+        if wait <= 0:
+            self.commit()
+        elif self.flush_timer is None:
+            self.flush_timer = threading.Timer(wait, self.flush)
+            self.flush_timer.daemon = True
+            self.flush_timer.start()
+
+    def flush(self):
+        """Commits changes that are still pending (called by the timer)."""
+        with self.lock:
+            self.flush_timer = None
+            # A running transaction commits everything when it ends
+            if not self.closed and not self.transactions and \
+                    self.connection.in_transaction:
+                self.commit()
+
+    def commit(self):
+        """Commits all pending changes now."""
+        with self.lock:
+            timer = time.perf_counter()
+            self.connection.commit()
+            self.seconds += time.perf_counter() - timer
+            self.last_commit = time.monotonic()
+
+    def close(self):
+        """Commits pending changes and closes the connection."""
+        with self.lock:
+            if self.flush_timer is not None:
+                self.flush_timer.cancel()
+                self.flush_timer = None
+            self.closed = True
+            self.connection.commit()
+            self.connection.close()
+
+    def measure(self, timer):
+        """Counts one query that started at given perf_counter time."""
+        self.queries += 1
+        self.seconds += time.perf_counter() - timer
+
+    def statistics(self) -> tuple:
+        """Returns (queries per second, milliseconds spent per second)
+        since the previous call."""
+        with self.lock:
+            elapsed = time.monotonic() - self.measured_since
+            result = (self.queries / elapsed, self.seconds * 1000 / elapsed)
+            self.queries = 0
+            self.seconds = 0.0
+            self.measured_since = time.monotonic()
+            return result
+
+
+# Rows of single-row tables
+UserSettings = collections.namedtuple(
+    "UserSettings", "show_real_fps ms_pause mousewheel_delta")
+SelectedPatterns = collections.namedtuple(
+    "SelectedPatterns", "len4 len5 len6 len7 len8 len9 reverse")
+
+
+class SettingsRepository:
+
+    def __init__(self, db):
+        """Typed access to user's settings with a write-through cache.
+
+        Every table is read once, later reads are served from memory.
+        Changes are written to the database and the cache together, and
+        only if something has actually changed.
+
+        :param db: Database to read from and write to
+        """
+        self.db = db
+        self.cache = {}  # table name: cached content
+
+    def create(self):
+        """Creates all tables and fills them with default settings."""
+        with self.db.transaction():
+            self.db.execute("""CREATE TABLE settings (
+                        show_real_fps integer,
+                        ms_pause integer,
+                        mousewheel_delta integer
+                        )""")
+            self.db.execute("""CREATE TABLE selected_patterns (
+                        len4 integer, len5 integer,
+                        len6 integer, len7 integer,
+                        len8 integer, len9 integer,
+                        reverse integer
+                        )""")
+            self.db.execute("""CREATE TABLE my_patterns (pattern text)""")
+            self.db.execute("""CREATE TABLE highest_fps (fps integer)""")
+            self.db.execute("""CREATE TABLE pattern_filter (query text)""")
+
+            # Setting up default settings
+            self.db.execute("INSERT INTO settings VALUES (0, 500, 150)")
+            self.db.execute("INSERT INTO selected_patterns "
+                            "VALUES (0, 0, 0, 0, 0, 0, 0)")
+            self.db.execute("INSERT INTO highest_fps VALUES (2)")
+            self.db.execute("INSERT INTO pattern_filter VALUES ('')")
+        self.cache.clear()
+
+    def upgrade(self):
+        """Adds what is missing in databases of older program versions."""
+        with self.db.transaction():
+            # Saved patterns are unique, older versions allowed duplicates
+            self.db.execute("""DELETE FROM my_patterns WHERE rowid NOT IN (
+                        SELECT MIN(rowid) FROM my_patterns GROUP BY pattern
+                        )""")
+            self.db.execute("""CREATE UNIQUE INDEX IF NOT EXISTS
+                        my_patterns_pattern ON my_patterns (pattern)""")
+            # Filter of selected patterns was added later
+            self.db.execute("""CREATE TABLE IF NOT EXISTS
+                        pattern_filter (query text)""")
+            self.db.execute("""INSERT INTO pattern_filter SELECT '' WHERE
+                        NOT EXISTS (SELECT * FROM pattern_filter)""")
+        self.cache.pop("my_patterns", None)
+
+    def cached(self, table, load):
+        """Returns cached content of a table, loads it on first use."""
+        if table not in self.cache:
+            self.cache[table] = load()
+        return self.cache[table]
+
+    @property
+    def settings(self) -> UserSettings:
+        return self.cached("settings", lambda: UserSettings(*self.db.query(
+            "SELECT show_real_fps, ms_pause, mousewheel_delta "
+            "FROM settings")[0]))
+
+    @settings.setter
+    def settings(self, values):
+        values = UserSettings(*values)
+        if values != self.settings:
+            self.db.execute("""UPDATE settings SET
+            show_real_fps = :show_real_fps,
+            ms_pause = :ms_pause,
+            mousewheel_delta = :mousewheel_delta""", values._asdict())
+            self.cache["settings"] = values
+
+    @property
+    def selected_patterns(self) -> SelectedPatterns:
+        return self.cached("selected_patterns", lambda: SelectedPatterns(
+            *self.db.query("SELECT len4, len5, len6, len7, len8, len9, "
+                           "reverse FROM selected_patterns")[0]))
+
+    @selected_patterns.setter
+    def selected_patterns(self, values):
+        values = SelectedPatterns(*values)
+        if values != self.selected_patterns:
+            self.db.execute("""UPDATE selected_patterns SET
+                        len4 = ?, len5 = ?, len6 = ?,
+                        len7 = ?, len8 = ?, len9 = ?,
+                        reverse = ?""", values)
+            self.cache["selected_patterns"] = values
+
+    @property
+    def highest_fps(self) -> float:
+        return self.cached("highest_fps", lambda: self.db.query(
+            "SELECT fps FROM highest_fps")[0][0])
+
+    @highest_fps.setter
+    def highest_fps(self, fps):
+        if fps != self.highest_fps:
+            self.db.execute("UPDATE highest_fps SET fps = ?", [fps])
+            self.cache["highest_fps"] = fps
+
+    @property
+    def pattern_filter(self) -> str:
+        """Filter query of selected patterns, see pattern_filter."""
+        return self.cached("pattern_filter", lambda: self.db.query(
+            "SELECT query FROM pattern_filter")[0][0])
+
+    @pattern_filter.setter
+    def pattern_filter(self, query):
+        if query != self.pattern_filter:
+            self.db.execute("UPDATE pattern_filter SET query = ?", [query])
+            self.cache["pattern_filter"] = query
+
+    def saved_patterns(self) -> dict:
+        """Returns the cache of saved patterns.
+
+        A dictionary keeps the order of saving and, like a set, checks
+        membership, adds and deletes in constant time.
+        """
+        return self.cached("my_patterns", lambda: dict.fromkeys(
+            row[0] for row in self.db.query(
+                "SELECT pattern FROM my_patterns ORDER BY rowid")))
+
+    @property
+    def my_patterns(self) -> tuple:
+        """Saved patterns as strings, e.g. "1236", in order of saving."""
+        return tuple(self.saved_patterns())
+
+    def is_saved(self, pattern) -> bool:
+        """Checks if a pattern (string of dots) is saved."""
+        return pattern in self.saved_patterns()
+
+    def add_pattern(self, pattern) -> bool:
+        """Saves a pattern (string of dots), unless it's already saved.
+
+        :return: True if the pattern was added
+        """
+        if self.is_saved(pattern):
+            return False
+        self.db.execute("INSERT OR IGNORE INTO my_patterns VALUES (?)",
+                        [pattern])
+        self.saved_patterns()[pattern] = None
+        return True
+
+    def delete_pattern(self, pattern):
+        """Deletes a saved pattern (string of dots)."""
+        if self.saved_patterns().pop(pattern, False) is None:
+            self.db.execute("DELETE FROM my_patterns WHERE pattern = ?",
+                            [pattern])
+
+    def add_patterns(self, patterns) -> int:
+        """Saves many patterns in one transaction, skips saved ones.
+
+        :return: Number of added patterns
+        """
+        saved = self.saved_patterns()
+        new_patterns = [pattern for pattern in dict.fromkeys(patterns)
+                        if pattern not in saved]
+        with self.db.transaction():
+            self.db.executemany("INSERT OR IGNORE INTO my_patterns VALUES (?)",
+                                [(pattern,) for pattern in new_patterns])
+        saved.update(dict.fromkeys(new_patterns))
+        return len(new_patterns)
+
+    def delete_patterns(self, patterns):
+        """Deletes many saved patterns in one transaction."""
+        saved = self.saved_patterns()
+        with self.db.transaction():
+            self.db.executemany("DELETE FROM my_patterns WHERE pattern = ?",
+                                [(pattern,) for pattern in patterns])
+        for pattern in patterns:
+            saved.pop(pattern, None)
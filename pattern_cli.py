@@ -0,0 +1,237 @@
+"""Command line interface to patterns, no display needed.
+
+    python pattern_cli.py count --grid 4x4
+    python pattern_cli.py generate --min 4 --max 5 --output patterns.csv
+    python pattern_cli.py filter "starts-with:1 min-crossings:3" --jobs 4
+    python pattern_cli.py stats --metric complexity --top 10 --length 9
+    python pattern_cli.py export --database user_settings.db
+
+Patterns are written one per line to stdout unless --output is given, in
+which case the file type is chosen by its extension (see pattern_io).
+"""
+import argparse
+import itertools
+import os
+import sqlite3
+import sys
+
+import database
+import pattern_engine
+import pattern_filter
+import pattern_grid
+import pattern_io
+import pattern_stats
+import pattern_store
+import pattern_strength
+
+
+def grid_size(text) -> tuple:
+    """Parses a grid size such as "4x4" into (columns, rows)."""
+    try:
+        columns, rows = (int(n) for n in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError("grid must look like 4x4")
+    return columns, rows
+
+
+def load_patterns(args) -> pattern_store.PatternStore:
+    """Generates all 3x3 patterns of the lengths given by arguments."""
+    if args.jobs > 1:
+        patterns, _timings = pattern_engine.generate_patterns_parallel(
+            args.min, args.max, args.jobs)
+        return pattern_store.PatternStore(patterns)
+    return pattern_store.PatternStore(
+        pattern_engine.generate_patterns(args.min, args.max))
+
+
+def pattern_text(pattern) -> str:
+    """Turns a pattern into text, e.g. "1236" or "1-2-3-16" if some dots
+    have more than one digit."""
+    dots = [str(dot) for dot in pattern]
+    return ("-" if any(len(dot) > 1 for dot in dots) else "").join(dots)
+
+
+def chunk_patterns(chunks):
+    """Generates patterns of chunks from Grid.iter_pattern_chunks as tuples
+    of dot numbers, one chunk at a time."""
+    for length, _first, chunk in chunks:
+        for position in range(0, len(chunk), length):
+            yield tuple(chunk[position:position + length])
+
+
+def write_output(args, patterns):
+    """Writes patterns (sequences of dots) to the output file or stdout."""
+    if args.output:
+        pattern_io.write_patterns(args.output, map(pattern_text, patterns))
+        return
+    for chunk in iter(lambda: list(itertools.islice(patterns, 4096)), []):
+        sys.stdout.writelines(pattern_text(pattern) + "\n"
+                              for pattern in chunk)
+
+
+def generate(args):
+    columns, rows = args.grid
+    if (columns, rows) == (3, 3) and args.jobs > 1:
+        write_output(args, iter(load_patterns(args)))
+    elif (columns, rows) == (3, 3):
+        write_output(args, pattern_engine.generate_patterns(args.min,
+                                                            args.max))
+    elif args.jobs > 1:
+        raise ValueError("--jobs only works on a 3x3 grid")
+    elif args.output and args.output.endswith("/"):
+        # A directory gets one file per (length, first dot)
+        grid = pattern_grid.Grid(columns, rows)
+        counts = grid.write_shards(args.output, args.min, args.max)
+        print(f"{sum(counts.values())} patterns in {len(counts)} shards",
+              file=sys.stderr)
+    else:
+        grid = pattern_grid.Grid(columns, rows)
+        if grid.size > 9 and args.output and \
+                args.output.lower().endswith(".bin"):
+            raise ValueError(".bin files only hold patterns of up to 9 dots, "
+                             "use .csv or .jsonl")
+        # Streamed in the order they are generated: by length, then by
+        # symmetry class of the first dot
+        write_output(args, chunk_patterns(grid.iter_pattern_chunks(
+            args.min, args.max)))
+
+
+def count(args):
+    columns, rows = args.grid
+    if (columns, rows) == (3, 3):
+        counts = pattern_engine.count_patterns(
+            args.min, args.max, args.start, args.end, args.include)
+    elif args.start or args.end or args.include:
+        raise ValueError("--start, --end and --include need a 3x3 grid")
+    else:
+        counts = pattern_grid.Grid(columns, rows).count_patterns(args.min,
+                                                                 args.max)
+    for length, n in counts.items():
+        print(f"{length}\t{n}")
+    print(f"total\t{sum(counts.values())}")
+
+
+def filter_patterns(args):
+    pattern_filter.parse_filter(args.query)  # fail before generating
+    patterns = load_patterns(args)
+    index = pattern_filter.PatternIndex(
+        patterns, pattern_stats.PatternStatistics(patterns))
+    write_output(args, iter(index.select(args.query)))
+
+
+def stats(args):
+    if args.length is not None and not args.min <= args.length <= args.max:
+        raise ValueError(f"--length must be from {args.min} to {args.max}")
+    if args.metric is None and args.top:
+        raise ValueError("--top needs a --metric")
+    patterns = load_patterns(args)
+    statistics = pattern_stats.PatternStatistics(patterns)
+    strength = pattern_strength.StrengthModel(patterns)
+    statistics.add_metric("strength", strength.score_patterns(patterns))
+    if args.metric is None:
+        print("metric\tmin\tmean\tmax")
+        for metric in statistics.metrics:
+            lowest, mean, highest = statistics.summary(metric, args.length)
+            print(f"{metric}\t{lowest:.6g}\t{mean:.6g}\t{highest:.6g}")
+    elif args.top:
+        for pattern, value in statistics.top(args.metric, args.top,
+                                             args.length, args.lowest):
+            print(f"{''.join(pattern)}\t{value:.6g}")
+    else:
+        for value, n in statistics.histogram(args.metric,
+                                             args.length).items():
+            print(f"{value:.6g}\t{n}")
+
+
+def export(args):
+    """Exports patterns saved in the program (My patterns)."""
+    if not os.path.isfile(args.database):
+        raise ValueError("No such database: " + args.database)
+    try:
+        db = database.Database(args.database)
+        try:
+            patterns = database.SettingsRepository(db).my_patterns
+        finally:
+            db.close()
+    except sqlite3.Error as error:
+        raise ValueError(f"Not a settings database: {error}")
+    write_output(args, iter(patterns))
+
+
+def parser() -> argparse.ArgumentParser:
+    main_parser = argparse.ArgumentParser(
+        description="Android unlock patterns without a display")
+    commands = main_parser.add_subparsers(dest="command", required=True)
+
+    def add_command(name, function, help_text, lengths=True, jobs=True):
+        command = commands.add_parser(name, help=help_text)
+        command.set_defaults(function=function)
+        if lengths:
+            command.add_argument("--min", type=int, default=4,
+                                 help="min. pattern length (default: 4)")
+            command.add_argument("--max", type=int, default=None,
+                                 help="max. pattern length (default: 9 "
+                                      "or all dots of the grid)")
+        if lengths and jobs:
+            command.add_argument("--jobs", type=int, default=1,
+                                 help="number of processes used to "
+                                      "generate patterns (3x3 only)")
+        command.add_argument("--output", "-o",
+                             help="file (.csv, .jsonl or .bin) to write to "
+                                  "instead of stdout")
+        return command
+
+    command = add_command("generate", generate, "write all valid patterns")
+    command.add_argument("--grid", type=grid_size, default=(3, 3),
+                         help="grid size, e.g. 4x4 (default: 3x3); "
+                              "an output directory ending with / gets "
+                              "one file per length and first dot")
+    command = add_command("count", count, "count valid patterns per length",
+                          jobs=False)
+    command.add_argument("--grid", type=grid_size, default=(3, 3),
+                         help="grid size, e.g. 4x4 (default: 3x3)")
+    command.add_argument("--start", help="first dot (3x3 only)")
+    command.add_argument("--end", help="last dot (3x3 only)")
+    command.add_argument("--include", default="",
+                         help="dots that must be visited, e.g. 159")
+    command = add_command("filter", filter_patterns,
+                          "write patterns that match a filter query")
+    command.add_argument("query", help='filter query, e.g. "starts-with:1 '
+                                       'min-crossings:2"')
+    command = add_command("stats", stats, "show statistics of all patterns")
+    command.add_argument("--metric", choices=pattern_stats.METRICS + (
+        "strength",), help="show a histogram (or --top) of one metric")
+    command.add_argument("--top", type=int, default=0,
+                         help="show patterns with the highest values")
+    command.add_argument("--lowest", action="store_true",
+                         help="with --top, show the lowest values instead")
+    command.add_argument("--length", type=int,
+                         help="only use patterns with this number of dots")
+    command = add_command("export", export, "write patterns saved in the "
+                                            "program", lengths=False)
+    command.add_argument("--database", default="user_settings.db",
+                         help="settings database (default: user_settings.db)")
+    return main_parser
+
+
+def main(argv=None) -> int:
+    main_parser = parser()
+    args = main_parser.parse_args(argv)
+    columns, rows = getattr(args, "grid", (3, 3))
+    if getattr(args, "max", 0) is None:
+        args.max = columns * rows
+    try:
+        if hasattr(args, "min") and not 1 <= args.min <= args.max <= \
+                columns * rows:
+            raise ValueError(f"lengths must be 1 <= --min <= --max <= "
+                             f"{columns * rows}")
+        args.function(args)
+    except BrokenPipeError:
+        pass  # e.g. piped into head
+    except (ValueError, OSError) as error:
+        main_parser.error(str(error))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,263 @@
+"""Pattern engine for android unlock patterns on a 3x3 grid.
+
+Other grids are handled by pattern_grid, which this module takes the
+rules of the 3x3 grid from.
+
+Dots are numbered like on a phone keypad:
+
+    1 2 3
+    4 5 6
+    7 8 9
+
+Nothing in this module depends on Tkinter, so it can be used
+(and benchmarked) without a display.
+"""
+import functools
+import time
+
+import pattern_grid
+
+# All dots of the grid, in the order patterns are enumerated
+DOTS = "123456789"
+DOT_NUMBERS = tuple(range(1, 10))
+
+GRID = pattern_grid.Grid(3, 3)
+
+# SKIP[a][b] is the dot lying exactly between a and b ("skip-over" dot),
+# or 0 if a and b are neighbours (or a knight move apart).
+# A move from a to b is only allowed if SKIP[a][b] was already visited.
+SKIP = [[0] * 10 for _ in range(10)]
+for _a in DOT_NUMBERS:
+    for _b in DOT_NUMBERS:
+        if _a != _b:
+            # On a 3x3 grid at most one dot lies between two others
+            SKIP[_a][_b] = sum(GRID.skipped_dots(_a, _b))
+del _a, _b
+
+# Flattened 10x10 "required intermediate dot" table as bit masks:
+# REQUIRED[a * 10 + b] is the bit of SKIP[a][b] (0 if nothing is skipped).
+# Row 0 belongs to the virtual start, so the first dot never requires one.
+REQUIRED = [1 << SKIP[_i // 10][_i % 10] if SKIP[_i // 10][_i % 10] else 0
+            for _i in range(100)]
+
+# Accepted representations of a single dot
+_DOT_INDEX = {**{str(n): n for n in DOT_NUMBERS},
+              **{n: n for n in DOT_NUMBERS}}
+
+# For every dot, all possible next moves in ascending order as tuples of
+# (next dot, next dot as string, bit of next dot, bit of the skipped dot)
+_MOVES = [[] for _ in range(10)]
+for _last in DOT_NUMBERS:
+    for _dot in DOT_NUMBERS:
+        if _dot != _last:
+            _middle = SKIP[_last][_dot]
+            _MOVES[_last].append(
+                (_dot, str(_dot), 1 << _dot, 1 << _middle if _middle else 0))
+del _last, _dot, _middle
+
+# Corner, edge and center dots with the dots that are symmetric to them.
+# Each next dot of a class is the previous one rotated by 90 degrees.
+SYMMETRY_CLASSES = {1: (1, 3, 9, 7), 2: (2, 6, 8, 4), 5: (5,)}
+_ROTATE = {"1": "3", "2": "6", "3": "9", "4": "2", "5": "5",
+           "6": "8", "7": "1", "8": "4", "9": "7"}
+
+
+def _walk(path, last, visited, remaining, found):
+    """Extends a valid prefix by every allowed dot (depth first)."""
+    for dot, char, bit, middle_bit in _MOVES[last]:
+        if visited & bit or (middle_bit and not visited & middle_bit):
+            continue
+        path.append(char)
+        if remaining == 1:
+            found.append(tuple(path))
+        else:
+            _walk(path, dot, visited | bit, remaining - 1, found)
+        path.pop()
+
+
+def iter_patterns(length, first_dots=DOT_NUMBERS):
+    """Generates all valid patterns of given length
+
+    Only valid prefixes are ever extended (backtracking), so invalid
+    permutations are never built. Patterns are yielded in the same
+    lexicographic order as filtered itertools.permutations("123456789").
+
+    :param length: Number of connected dots (1 to 9)
+    :param first_dots: Dots the patterns may start with
+    :return: Generator of tuples such as ("1", "2", "3", "6")
+    """
+    for chunk in iter_pattern_chunks(length, first_dots):
+        yield from chunk
+
+
+def iter_pattern_chunks(length, first_dots=DOT_NUMBERS):
+    """Same as iter_patterns, but yields a list of patterns per first dot."""
+    for first in first_dots:
+        found = []
+        if length == 1:
+            found.append((str(first),))
+        else:
+            _walk([str(first)], first, 1 << first, length - 1, found)
+        yield found
+
+
+def generate_patterns(min_length=4, max_length=9):
+    """Generates all valid patterns ordered by length, then lexicographically.
+
+    :param min_length: Min. pattern length
+    :param max_length: Max. pattern length (inclusive)
+    """
+    for length in range(min_length, max_length + 1):
+        yield from iter_patterns(length)
+
+
+def is_valid_pattern(pattern) -> bool:
+    """Checks if a pattern is valid based on pattern rules for android.
+
+    Every step is a table lookup and a test against a 9-bit visited mask.
+
+    :param pattern: Sequence of dots, e.g. ("1", "2", "3"), "123" or (1, 2, 3)
+    """
+    visited = last = 0
+    for dot in pattern:
+        dot = _DOT_INDEX.get(dot)
+        if dot is None:
+            return False
+        bit = 1 << dot
+        required = REQUIRED[last * 10 + dot]
+        if visited & bit or (required and not visited & required):
+            return False
+        visited |= bit
+        last = dot
+    return visited != 0
+
+
+def validate_patterns(candidates) -> bytearray:
+    """Validates many candidate patterns at once (e.g. imported wordlists).
+
+    Same check as is_valid_pattern, inlined into one loop with the tables
+    in local variables, so a candidate costs no function call. Nothing is
+    kept per candidate, so memory doesn't grow with the wordlist.
+
+    :param candidates: Iterable of strings or tuples accepted by
+    is_valid_pattern
+    :return: Boolean vector, 1 for every valid candidate and 0 otherwise
+    """
+    dot_index = _DOT_INDEX
+    required_bits = REQUIRED
+    results = bytearray()
+    append = results.append
+    for candidate in candidates:
+        visited = last = 0
+        for dot in candidate:
+            dot = dot_index.get(dot)
+            if dot is None:
+                break
+            bit = 1 << dot
+            if visited & bit or required_bits[last * 10 + dot] & ~visited:
+                break
+            visited |= bit
+            last = dot
+        else:
+            append(visited != 0)
+            continue
+        append(0)
+    return results
+
+
+@functools.lru_cache(maxsize=None)
+def _count(max_length, start, end, required) -> tuple:
+    """Counts of the dynamic program of pattern_grid, cached."""
+    return tuple(GRID.python_counts(max_length, start, end, required))
+
+
+def count_patterns(min_length=4, max_length=9, start=None, end=None,
+                   include=()) -> dict:
+    """Counts valid patterns per length without enumerating them
+
+    :param min_length: Min. pattern length
+    :param max_length: Max. pattern length (inclusive)
+    :param start: Only count patterns starting with this dot
+    :param end: Only count patterns ending with this dot
+    :param include: Only count patterns that visit all of these dots
+    :return: Dictionary of {pattern length: number of patterns}
+    :raises ValueError: If lengths are not 1 <= min_length <= max_length
+    or start, end or include is not a dot
+    """
+    if not 1 <= min_length <= max_length:
+        raise ValueError("Lengths must be 1 <= min. <= max. length")
+    for dot in (*include, *(x for x in (start, end) if x is not None)):
+        if dot not in _DOT_INDEX:
+            raise ValueError(f"Not a dot: {dot!r}")
+    required = 0
+    for dot in include:
+        required |= GRID.bit(_DOT_INDEX[dot])
+    counts = _count(max_length,
+                    None if start is None else _DOT_INDEX[start],
+                    None if end is None else _DOT_INDEX[end], required)
+    return {length: counts[length]
+            for length in range(min_length, max_length + 1)}
+
+
+def _generate_symmetry_class(task) -> tuple:
+    """Process pool worker: generates patterns of one symmetry class.
+
+    Only patterns starting with the representative dot are enumerated,
+    patterns of the other dots in its class are rotated copies of them.
+
+    :param task: Tuple of (representative dot, pattern length)
+    :return: Tuple of (task, {first dot: patterns}, seconds spent)
+    """
+    timer = time.perf_counter()
+    representative, length = task
+    patterns = list(iter_patterns(length, (representative,)))
+    shards = {representative: patterns}
+    for first in SYMMETRY_CLASSES[representative][1:]:
+        patterns = sorted(tuple(_ROTATE[dot] for dot in pattern)
+                          for pattern in patterns)
+        shards[first] = patterns
+    return task, shards, time.perf_counter() - timer
+
+
+def generate_patterns_parallel(min_length=4, max_length=9, jobs=None,
+                               length_done=None) -> tuple:
+    """Generates all valid patterns in a pool of processes
+
+    Work is split by (symmetry class of the first dot, length) and the
+    results are merged back in the same order as generate_patterns.
+
+    :param min_length: Min. pattern length
+    :param max_length: Max. pattern length (inclusive)
+    :param jobs: Number of processes, defaults to the number of CPUs
+    :param length_done: Called with a length once all its patterns are ready
+    :return: Tuple of (all patterns, {(first dot, length): worker seconds})
+    """
+    import multiprocessing  # only needed with more than one job
+    tasks = [(representative, length)
+             for length in range(min_length, max_length + 1)
+             for representative in SYMMETRY_CLASSES]
+    # Biggest tasks first, so that no worker is left alone with one at the end
+    tasks.sort(key=lambda task: count_patterns(
+        task[1], task[1], start=task[0])[task[1]]
+        * len(SYMMETRY_CLASSES[task[0]]), reverse=True)
+
+    shards = {}
+    timings = {}
+    tasks_left = {length: len(SYMMETRY_CLASSES)
+                  for length in range(min_length, max_length + 1)}
+    # Spawned processes don't inherit any state of the (threaded) caller
+    with multiprocessing.get_context("spawn").Pool(jobs) as pool:
+        for (representative, length), found, seconds in pool.imap_unordered(
+                _generate_symmetry_class, tasks):
+            timings[(representative, length)] = seconds
+            for first, patterns in found.items():
+                shards[(first, length)] = patterns
+            tasks_left[length] -= 1
+            if not tasks_left[length] and length_done:
+                length_done(length)
+
+    all_patterns = []
+    for length in range(min_length, max_length + 1):
+        for first in DOT_NUMBERS:
+            all_patterns.extend(shards[(first, length)])
+    return all_patterns, timings
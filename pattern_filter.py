@@ -0,0 +1,205 @@
+"""Filters that select patterns with a short query language.
+
+A query is a list of conditions separated by spaces, a pattern is selected
+if it meets all of them. Any condition can be negated with "not":
+
+    starts-with:1         first dot is 1
+    ends-with:9           last dot is 9
+    contains-dot:5        pattern goes through dot 5
+    contains-segment:1-5  pattern has a line between dots 1 and 5
+                          (in any direction)
+    min-crossings:3       lines cross at 3 or more points
+    no-knight-moves       no line moves like a chess knight (1 by 2)
+    length:4-6            pattern has 4 to 6 dots (or length:5)
+
+For example "starts-with:1 not contains-dot:5 min-crossings:2".
+
+Queries are evaluated on bitmaps: for every condition the index keeps an
+integer whose bit i is set if pattern i meets it, so a query costs a few
+big integer ANDs no matter how many patterns are selected.
+"""
+import re
+
+import pattern_grid
+import pattern_stats
+import pattern_store
+
+DOTS = "123456789"
+PREDICATES = ("starts-with", "ends-with", "contains-dot", "contains-segment",
+              "min-crossings", "no-knight-moves", "length")
+
+# Turns a flag byte (0 or 1) into a binary digit
+_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def bitmap(flags) -> int:
+    """Packs flags (bytes of 0 or 1, one for each pattern) into a bitmap."""
+    return int(bytes(flags).translate(_DIGITS)[::-1] or b"0", 2)
+
+
+def bitmap_ranges(bits) -> list:
+    """Returns ranges of consecutive set bits of a bitmap, e.g. 0b1110
+    becomes [range(1, 4)]."""
+    return [range(match.start(), match.end())
+            for match in re.finditer("1+", format(bits, "b")[::-1])]
+
+
+def parse_filter(query) -> list:
+    """Splits a query into conditions.
+
+    :return: List of (negated, predicate, argument) where the argument is
+    a dot, a segment as a sorted pair of dots, a range of numbers or None
+    :raises ValueError: If the query is not valid
+    """
+    conditions = []
+    negated = False
+    for word in query.lower().split():
+        if word == "not":
+            negated = not negated
+            continue
+        predicate, _, argument = word.partition(":")
+        if predicate not in PREDICATES:
+            raise ValueError(f"Unknown condition: {predicate}")
+        if predicate == "no-knight-moves":
+            if argument:
+                raise ValueError("no-knight-moves takes no argument")
+            argument = None
+        elif predicate in ("starts-with", "ends-with", "contains-dot"):
+            if len(argument) != 1 or argument not in DOTS:
+                raise ValueError(f"{predicate} needs a dot from 1 to 9")
+        elif predicate == "contains-segment":
+            dots = argument.replace("-", "")
+            if len(dots) != 2 or dots[0] == dots[1] or \
+                    not set(dots) <= set(DOTS):
+                raise ValueError(f"{predicate} needs two dots, e.g. 1-5")
+            argument = tuple(sorted(dots))
+        elif predicate == "min-crossings":
+            if not argument.isdigit():
+                raise ValueError(f"{predicate} needs a number")
+            argument = range(int(argument), 256)
+        else:
+            low, _, high = argument.partition("-")
+            if not low.isdigit() or not (high or low).isdigit():
+                raise ValueError(f"{predicate} needs a number, e.g. 4-6")
+            argument = range(int(low), int(high or low) + 1)
+        conditions.append((negated, predicate, argument))
+        negated = False
+    if negated:
+        raise ValueError("Nothing follows 'not'")
+    return conditions
+
+
+class PatternIndex:
+
+    def __init__(self, patterns, statistics):
+        """Bitmaps of all conditions for a set of patterns.
+
+        :param patterns: PatternStore with all patterns
+        :param statistics: PatternStatistics of the same patterns
+        """
+        self.patterns = patterns
+        self.size = len(patterns)
+        self.everything = (1 << self.size) - 1
+        if pattern_stats.uses_numpy(patterns):
+            flags = self.numpy_flags(patterns)
+        else:
+            flags = self.python_flags(patterns)
+        self.first_dot, self.last_dot, self.dots, self.segments = (
+            {key: bitmap(value) for key, value in table.items()}
+            for table in flags)
+
+        # Numeric conditions are read from statistics, a byte translation
+        # table turns every value into a flag
+        self.statistics = statistics
+        self.value_bitmaps = {}  # (metric, range of values): bitmap
+        self.no_knight_moves = self.values_bitmap("knight_moves", range(1))
+
+    @staticmethod
+    def python_flags(patterns) -> tuple:
+        """Returns flags of first dots, last dots, dots and segments."""
+        size = len(patterns)
+        first_dot, last_dot, dots = ({dot: bytearray(size) for dot in DOTS}
+                                     for _ in range(3))
+        segments = {(a, b): bytearray(size) for a in DOTS for b in DOTS
+                    if a < b}
+        for i, pattern in enumerate(patterns):
+            first_dot[pattern[0]][i] = 1
+            last_dot[pattern[-1]][i] = 1
+            for dot in pattern:
+                dots[dot][i] = 1
+            for a, b in zip(pattern, pattern[1:]):
+                segments[min(a, b), max(a, b)][i] = 1
+        return first_dot, last_dot, dots, segments
+
+    @staticmethod
+    def numpy_flags(store) -> tuple:
+        """Returns flags of first dots, last dots, dots and segments,
+        computed with NumPy from a PatternStore."""
+        numpy = pattern_grid.load_numpy()
+        table = pattern_stats.dot_table(store, columns=10)
+        lengths = (table > 0).sum(axis=1)
+        first = table[:, 0]
+        last = table[numpy.arange(len(store)), lengths - 1]
+        low = numpy.minimum(table[:, :-1], table[:, 1:])
+        high = numpy.maximum(table[:, :-1], table[:, 1:])
+        segment_codes = numpy.where(low > 0, low * 10 + high, 0)
+
+        def flags(mask):
+            return mask.astype(numpy.uint8).tobytes()
+
+        return ({dot: flags(first == int(dot)) for dot in DOTS},
+                {dot: flags(last == int(dot)) for dot in DOTS},
+                {dot: flags((table == int(dot)).any(axis=1)) for dot in DOTS},
+                {(a, b): flags((segment_codes == int(a + b)).any(axis=1))
+                 for a in DOTS for b in DOTS if a < b})
+
+    def values_bitmap(self, metric, values) -> int:
+        """Returns bitmap of patterns whose metric is in a range of values."""
+        key = (metric, values)
+        if key not in self.value_bitmaps:
+            table = bytes(value in values for value in range(256))
+            self.value_bitmaps[key] = bitmap(
+                self.statistics.metrics[metric].tobytes().translate(table))
+        return self.value_bitmaps[key]
+
+    def condition_bitmap(self, predicate, argument) -> int:
+        """Returns bitmap of patterns that meet a single condition."""
+        if predicate == "starts-with":
+            return self.first_dot[argument]
+        if predicate == "ends-with":
+            return self.last_dot[argument]
+        if predicate == "contains-dot":
+            return self.dots[argument]
+        if predicate == "contains-segment":
+            return self.segments[argument]
+        if predicate == "min-crossings":
+            return self.values_bitmap("crossings", argument)
+        if predicate == "no-knight-moves":
+            return self.no_knight_moves
+        # Number of dots is one more than the number of lines
+        return self.values_bitmap("segments", range(
+            max(argument.start - 1, 0), max(argument.stop - 1, 0)))
+
+    def evaluate(self, query) -> int:
+        """Returns bitmap of all patterns that match a query.
+
+        :raises ValueError: If the query is not valid
+        """
+        bits = self.everything
+        for negated, predicate, argument in parse_filter(query):
+            condition = self.condition_bitmap(predicate, argument)
+            bits &= ~condition if negated else condition
+        return bits
+
+    def select(self, query, lengths=None) -> pattern_store.PatternView:
+        """Returns a lazy view of all patterns that match a query.
+
+        :param query: Filter query, e.g. "starts-with:1 min-crossings:2"
+        :param lengths: If given, only patterns of these lengths are selected
+        :raises ValueError: If the query is not valid
+        """
+        bits = self.evaluate(query)
+        if lengths is not None:
+            bits &= self.values_bitmap("segments", frozenset(
+                length - 1 for length in lengths))
+        return pattern_store.PatternView(self.patterns, bitmap_ranges(bits))
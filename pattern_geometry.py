@@ -0,0 +1,179 @@
+"""Exact geometry of patterns in grid coordinates.
+
+Dot d lies at column (d - 1) % 3 and row (d - 1) // 3, so dot 1 is at
+(0, 0) and dot 9 at (2, 2). All coordinates are small integers, which
+makes every test exact: orientation tests use integer cross products and
+crossing points are Fractions. Nothing here depends on the screen layout.
+"""
+import collections
+import functools
+from array import array
+from fractions import Fraction
+
+POINTS = {dot: ((dot - 1) % 3, (dot - 1) // 3) for dot in range(1, 10)}
+
+# All 72 lines between two different dots
+SEGMENTS = [(a, b) for a in range(1, 10) for b in range(1, 10) if a != b]
+
+
+def orientation(p, q, r) -> int:
+    """Returns 1 if points p, q and r turn counter-clockwise,
+    -1 if they turn clockwise and 0 if they are collinear."""
+    cross = (q[0] - p[0]) * (r[1] - p[1]) - (q[1] - p[1]) * (r[0] - p[0])
+    return (cross > 0) - (cross < 0)
+
+
+def relation(a, b, c, d):
+    """Finds out how the line from dot a to dot b meets the line from c to d
+
+    :return: True if lines are overlapping (share more than one point),
+    crossing point as a tuple of Fractions if they cross anywhere but
+    at a dot, False otherwise
+    """
+    p, q, r, s = POINTS[a], POINTS[b], POINTS[c], POINTS[d]
+    o1, o2 = orientation(p, q, r), orientation(p, q, s)
+    o3, o4 = orientation(r, s, p), orientation(r, s, q)
+
+    if o1 == o2 == 0:
+        # Collinear lines overlap if their projections share an interval
+        axis = 0 if p[0] != q[0] else 1
+        low = max(min(p[axis], q[axis]), min(r[axis], s[axis]))
+        high = min(max(p[axis], q[axis]), max(r[axis], s[axis]))
+        return low < high
+
+    if o1 * o2 < 0 and o3 * o4 < 0:
+        # Lines cross at p + t * (q - p)
+        t = Fraction((r[0] - p[0]) * (s[1] - r[1]) -
+                     (r[1] - p[1]) * (s[0] - r[0]),
+                     (q[0] - p[0]) * (s[1] - r[1]) -
+                     (q[1] - p[1]) * (s[0] - r[0]))
+        x, y = p[0] + t * (q[0] - p[0]), p[1] + t * (q[1] - p[1])
+        # Lines crossing at a (visited) dot are not intersecting
+        if x.denominator == y.denominator == 1:
+            return False
+        return x, y
+    return False
+
+
+# Tables of how every pair of lines meets, see relation_tables
+RelationTables = collections.namedtuple(
+    "RelationTables", "relations crossing_points crossing_bits overlaps")
+
+
+@functools.lru_cache(maxsize=None)
+def relation_tables() -> RelationTables:
+    """Builds tables of all 72 x 72 pairs of lines on first use, because
+    exact Fractions make it the slowest part of importing the program.
+
+    relations[(a * 10 + b) * 100 + c * 10 + d] is relation(a, b, c, d).
+    Every crossing point gets its own bit in crossing_bits, so that points
+    shared by more than two lines are only counted once, and overlaps is 1
+    for overlapping pairs.
+    """
+    relations = [False] * 10000
+    for a, b in SEGMENTS:
+        for c, d in SEGMENTS:
+            relations[(a * 10 + b) * 100 + c * 10 + d] = relation(a, b, c, d)
+
+    crossing_points = sorted({result for result in relations
+                              if isinstance(result, tuple)})
+    crossing_bits = [0] * 10000
+    overlaps = bytearray(10000)
+    for i, result in enumerate(relations):
+        if result is True:
+            overlaps[i] = 1
+        elif result:
+            crossing_bits[i] = 1 << crossing_points.index(result)
+    return RelationTables(relations, crossing_points, crossing_bits, overlaps)
+
+
+# Index of the line between two dots given as strings or numbers
+SEGMENT_INDEX = {}
+for _a, _b in SEGMENTS:
+    SEGMENT_INDEX[_a, _b] = SEGMENT_INDEX[str(_a), str(_b)] = _a * 10 + _b
+del _a, _b
+
+
+def pattern_geometry(pattern) -> tuple:
+    """Finds all crossing points and overlapping lines of a pattern
+
+    :param pattern: Sequence of dots, e.g. "1236" or ("1", "2", "3", "6")
+    :return: Tuple of (list of crossing points, number of overlapping
+    pairs of lines)
+    """
+    dots = [int(dot) for dot in pattern]
+    state, previous_segments = (0, 0), []
+    for a, b in zip(dots, dots[1:]):
+        state = add_line(state, previous_segments, a * 10 + b)
+        previous_segments.append((a * 10 + b) * 100)
+    crossings, overlaps = state
+    return [point for bit, point in enumerate(
+        relation_tables().crossing_points)
+            if crossings >> bit & 1], overlaps
+
+
+def add_line(state, previous_segments, segment) -> tuple:
+    """Adds a line to crossing bits and overlaps of a pattern.
+
+    :param state: Tuple of (crossing bits, overlaps) of the previous lines
+    :param previous_segments: Indices of the previous lines, times 100
+    :param segment: Index of the new line
+    :return: Tuple of (crossing bits, overlaps) including the new line
+    """
+    crossings, overlaps = state
+    _relations, _points, crossing_bits, overlap_table = relation_tables()
+    for previous in previous_segments:
+        crossings |= crossing_bits[previous + segment]
+        overlaps += overlap_table[previous + segment]
+    return crossings, overlaps
+
+
+def fold_lines(patterns, initial, step):
+    """Folds the lines of every pattern into a state, in one pass
+
+    Work done for a prefix is reused by the next pattern with the same
+    prefix, so patterns in enumeration order cost only a few steps each.
+
+    :param patterns: Iterable of patterns, e.g. a PatternStore
+    :param initial: State of a pattern without lines
+    :param step: Called as step(state, previous segments, segment) for
+    every line and returns the next state, like add_line
+    :return: Generator of (pattern, state of all its lines)
+    """
+    previous_pattern = ()
+    # For each line of the previous pattern: its segment index (times
+    # 100), and the state of the pattern up to that line
+    segments, states = [], [initial]
+    for pattern in patterns:
+        # Keep lines shared with the previous pattern
+        shared = 0
+        for old, new in zip(previous_pattern, pattern):
+            if old != new:
+                break
+            shared += 1
+        kept = max(shared - 1, 0)
+        del segments[kept:], states[kept + 1:]
+
+        state = states[-1]
+        for i in range(kept, len(pattern) - 1):
+            segment = SEGMENT_INDEX[pattern[i], pattern[i + 1]]
+            state = step(state, segments, segment)
+            segments.append(segment * 100)
+            states.append(state)
+        yield pattern, state
+        previous_pattern = pattern
+
+
+def crossing_counts(patterns) -> tuple:
+    """Counts crossing points and overlaps of every pattern in one pass.
+
+    :param patterns: Iterable of patterns, e.g. a PatternStore
+    :return: Tuple of (array of crossing counts, array of overlap counts)
+    """
+    crossing_totals = array("B")
+    overlap_totals = array("B")
+    for _pattern, (crossings, overlaps) in fold_lines(patterns, (0, 0),
+                                                      add_line):
+        crossing_totals.append(bin(crossings).count("1"))
+        overlap_totals.append(overlaps)
+    return crossing_totals, overlap_totals
@@ -0,0 +1,355 @@
+"""Unlock patterns on any grid of columns x rows dots.
+
+Dots are numbered row by row starting with 1, so on a 4x4 grid:
+
+     1  2  3  4
+     5  6  7  8
+     9 10 11 12
+    13 14 15 16
+
+A line from one dot to another goes through every lattice point between
+them: if the line moves (dx, dy), there are gcd(dx, dy) - 1 such points
+at steps of (dx, dy) / gcd. A move is only allowed if all of them were
+already visited, which is the 3x3 rule of pattern_engine on any grid.
+
+Patterns of big grids don't fit in memory (a 4x4 grid has billions), so
+they are generated as a stream of chunks: bytes objects in which every
+pattern takes one byte per dot. Counting never enumerates patterns.
+"""
+import functools
+import math
+import os
+
+# Patterns per chunk of generated patterns
+CHUNK_SIZE = 65536
+
+
+@functools.lru_cache(maxsize=None)
+def load_numpy():
+    """Imports NumPy on first use and returns it, or None if it's not
+    installed. It takes longer to import than the rest of the program,
+    which only needs it for counting and statistics."""
+    try:
+        import numpy
+    except ImportError:  # pure Python is used instead
+        return None
+    return numpy
+
+
+class Grid:
+
+    def __init__(self, columns=3, rows=3):
+        """Rules of a grid of columns x rows dots.
+
+        Bit dot - 1 of a visited mask is set if the dot was visited, so
+        masks of a 4x4 grid are 16-bit numbers.
+        """
+        if columns < 1 or rows < 1 or columns * rows > 255:
+            raise ValueError("Grid must have 1 to 255 dots")
+        self.columns = columns
+        self.rows = rows
+        self.size = columns * rows
+        self.dots = tuple(range(1, self.size + 1))
+        # Position (column, row) of every dot, index 0 is not used
+        self.points = [None] + [((dot - 1) % columns, (dot - 1) // columns)
+                                for dot in self.dots]
+
+        # For every dot, all possible next moves in ascending order as tuples
+        # of (next dot, bit of next dot, bits of dots that must be visited)
+        self.moves = [[] for _ in range(self.size + 1)]
+        for last in self.dots:
+            for dot in self.dots:
+                if dot != last:
+                    required = 0
+                    for middle in self.skipped_dots(last, dot):
+                        required |= self.bit(middle)
+                    self.moves[last].append((dot, self.bit(dot), required))
+
+        # Symmetries of the grid as translation tables for bytes.translate
+        self.symmetries = []
+        for swap in ((False, True) if columns == rows else (False,)):
+            for flip_x in (False, True):
+                for flip_y in (False, True):
+                    table = bytearray(range(256))
+                    for dot in self.dots:
+                        x, y = self.points[dot]
+                        if swap:
+                            x, y = y, x
+                        if flip_x:
+                            x = columns - 1 - x
+                        if flip_y:
+                            y = rows - 1 - y
+                        table[dot] = self.dot_at(x, y)
+                    self.symmetries.append(bytes(table))
+
+        # Dots that are symmetric to each other start the same patterns, so
+        # only the first dot of a class is ever walked. For every other dot
+        # of the class there's a table that maps its patterns.
+        self.symmetry_classes = {}  # first dot of a class: {dot: table}
+        for dot in self.dots:
+            if not any(dot in members
+                       for members in self.symmetry_classes.values()):
+                members = {}
+                for table in self.symmetries:
+                    members.setdefault(table[dot], table)
+                self.symmetry_classes[dot] = dict(sorted(members.items()))
+
+    def __repr__(self):
+        return f"Grid({self.columns}, {self.rows})"
+
+    @staticmethod
+    def bit(dot) -> int:
+        """Returns the bit of a dot in visited masks."""
+        return 1 << dot - 1
+
+    def dot_at(self, x, y) -> int:
+        """Returns the dot at column x and row y."""
+        return y * self.columns + x + 1
+
+    def skipped_dots(self, a, b) -> list:
+        """Returns dots that lie exactly on the line from a to b."""
+        (xa, ya), (xb, yb) = self.points[a], self.points[b]
+        steps = math.gcd(xb - xa, yb - ya)
+        return [self.dot_at(xa + (xb - xa) // steps * i,
+                            ya + (yb - ya) // steps * i)
+                for i in range(1, steps)]
+
+    def is_valid_pattern(self, pattern) -> bool:
+        """Checks if a pattern (sequence of dot numbers) is valid."""
+        visited = 0
+        moves = [(dot, self.bit(dot), 0) for dot in self.dots]
+        for dot in pattern:
+            for next_dot, bit, required in moves:
+                if next_dot == dot:
+                    break
+            else:
+                return False
+            if visited & bit or visited & required != required:
+                return False
+            visited |= bit
+            moves = self.moves[dot]
+        return visited != 0
+
+    def walk(self, first, length, chunk_size=CHUNK_SIZE):
+        """Generates all valid patterns of given length that start with
+        a dot, depth first with an explicit stack.
+
+        :return: Generator of chunks (bytes) of up to chunk_size patterns,
+        in ascending order
+        """
+        if length == 1:
+            yield bytes([first])
+            return
+        moves = self.moves
+        chunk = bytearray()
+        chunk_bytes = chunk_size * length
+        path = bytearray([first])
+        visited = [self.bit(first)]
+        stack = [iter(moves[first])]
+        while stack:
+            for dot, bit, required in stack[-1]:
+                mask = visited[-1]
+                if mask & bit or mask & required != required:
+                    continue
+                if len(path) == length - 1:
+                    chunk += path
+                    chunk.append(dot)
+                    if len(chunk) >= chunk_bytes:
+                        yield bytes(chunk)
+                        chunk.clear()
+                    continue
+                # Go one dot deeper
+                path.append(dot)
+                visited.append(mask | bit)
+                stack.append(iter(moves[dot]))
+                break
+            else:
+                # All moves of the last dot were tried, go one dot back
+                stack.pop()
+                visited.pop()
+                path.pop()
+        if chunk:
+            yield bytes(chunk)
+
+    def iter_pattern_chunks(self, min_length=4, max_length=None,
+                            first_dots=None, chunk_size=CHUNK_SIZE):
+        """Generates all valid patterns as a stream of chunks
+
+        Lengths are walked one after another (iterative deepening), so
+        memory use doesn't depend on the number of patterns. Patterns of
+        only one dot of every symmetry class are walked, each of its chunks
+        is translated into chunks of the other dots of the class.
+
+        :param min_length: Min. pattern length
+        :param max_length: Max. pattern length (inclusive), defaults to all
+        dots
+        :param first_dots: Dots the patterns may start with, defaults to all
+        :param chunk_size: Max. number of patterns in a chunk
+        :return: Generator of (pattern length, first dot, chunk) where every
+        pattern of the chunk takes pattern length bytes
+        """
+        if max_length is None:
+            max_length = self.size
+        first_dots = set(self.dots if first_dots is None else first_dots)
+        for length in range(min_length, max_length + 1):
+            for representative, members in self.symmetry_classes.items():
+                members = {dot: table for dot, table in members.items()
+                           if dot in first_dots}
+                if not members:
+                    continue
+                for chunk in self.walk(representative, length, chunk_size):
+                    for dot, table in members.items():
+                        yield length, dot, chunk.translate(table)
+
+    def iter_patterns(self, min_length=4, max_length=None, first_dots=None):
+        """Generates all valid patterns as tuples of dot numbers, ordered
+        by length and first dot (not lexicographically within a first dot).
+
+        Chunks of one length are kept in memory to be ordered, so this is
+        meant for small grids, see iter_pattern_chunks.
+        """
+        if max_length is None:
+            max_length = self.size
+        for length in range(min_length, max_length + 1):
+            chunks = sorted(self.iter_pattern_chunks(length, length,
+                                                     first_dots),
+                            key=lambda item: item[1])
+            for _length, _dot, chunk in chunks:
+                for position in range(0, len(chunk), length):
+                    yield tuple(chunk[position:position + length])
+
+    def count_patterns(self, min_length=4, max_length=None) -> dict:
+        """Counts valid patterns per length without enumerating them
+
+        A dynamic program over (visited mask, last dot) states: with NumPy
+        all states of a number of visited dots are extended at once,
+        otherwise one dot of every symmetry class is counted in Python.
+
+        :return: Dictionary of {pattern length: number of patterns}
+        :raises ValueError: If lengths are not 1 <= min_length <= max_length
+        """
+        if max_length is None:
+            max_length = self.size
+        if not 1 <= min_length <= max_length:
+            raise ValueError("Lengths must be 1 <= min. <= max. length")
+        if load_numpy() is not None and self.size <= 16:
+            counts = self.numpy_counts(max_length)
+        else:
+            counts = self.python_counts(max_length)
+        return {length: counts[length]
+                for length in range(min_length, max_length + 1)}
+
+    def python_counts(self, max_length, start=None, end=None,
+                      required=0) -> list:
+        """Counts patterns of every length up to max_length in Python.
+
+        :param start: Only count patterns starting with this dot
+        :param end: Only count patterns ending with this dot
+        :param required: Bits of dots that counted patterns must visit
+        :return: List of counts, index is the pattern length
+        """
+        if start is not None:
+            starts = {start: 1}
+        elif end is None and not required:
+            # Symmetric dots start the same number of patterns, so only
+            # one dot of every symmetry class is walked
+            starts = {first: len(members) for first, members
+                      in self.symmetry_classes.items()}
+        else:
+            starts = dict.fromkeys(self.dots, 1)
+
+        counts = [0] * (max_length + 1)
+        for first, weight in starts.items():
+            ways = {(self.bit(first), first): 1}
+            for length in range(1, max_length + 1):
+                counts[length] += weight * sum(
+                    n for (visited, last), n in ways.items()
+                    if (end is None or last == end) and
+                    visited & required == required)
+                if length == max_length:
+                    break
+
+                # Extend every state by one allowed dot
+                next_ways = {}
+                for (visited, last), n in ways.items():
+                    for dot, bit, required_bits in self.moves[last]:
+                        if visited & bit or \
+                                visited & required_bits != required_bits:
+                            continue
+                        key = (visited | bit, dot)
+                        next_ways[key] = next_ways.get(key, 0) + n
+                ways = next_ways
+        return counts
+
+    def numpy_counts(self, max_length) -> list:
+        """Counts patterns of every length up to max_length with NumPy."""
+        numpy = load_numpy()
+        masks = numpy.arange(1 << self.size)
+        popcounts = numpy.zeros(len(masks), numpy.intp)
+        for dot in self.dots:
+            popcounts += masks >> dot - 1 & 1
+        # ways[mask, dot - 1] is the number of patterns that visit the dots
+        # of the mask and end with the dot
+        ways = numpy.zeros((len(masks), self.size), numpy.int64)
+        for dot in self.dots:
+            ways[self.bit(dot), dot - 1] = 1
+
+        counts = [0] * (max_length + 1)
+        for length in range(1, max_length + 1):
+            layer = masks[popcounts == length]
+            counts[length] = int(ways[layer].sum())
+            if length == max_length:
+                break
+            for last in self.dots:
+                has_last = layer[layer & self.bit(last) != 0]
+                for dot, bit, required in self.moves[last]:
+                    allowed = has_last[(has_last & bit == 0) &
+                                       (has_last & required == required)]
+                    # Targets are all different, so += adds every state
+                    ways[allowed | bit, dot - 1] += ways[allowed, last - 1]
+        return counts
+
+    def shard_name(self, length, first) -> str:
+        """Returns the file name of a shard of patterns."""
+        return f"patterns-{self.columns}x{self.rows}-{length}-{first}.dots"
+
+    def write_shards(self, directory, min_length=4, max_length=None,
+                     first_dots=None, chunk_size=CHUNK_SIZE) -> dict:
+        """Writes patterns into one file per (length, first dot)
+
+        Every file is a plain sequence of patterns of the same length, one
+        byte per dot. Chunks are written as soon as they are generated, and
+        only files of the current length are open.
+
+        :return: Dictionary of {(length, first dot): number of patterns}
+        """
+        os.makedirs(directory, exist_ok=True)
+        counts = {}
+        files = {}
+        try:
+            for length, first, chunk in self.iter_pattern_chunks(
+                    min_length, max_length, first_dots, chunk_size):
+                if (length, first) not in files:
+                    # Shards of shorter patterns are complete
+                    for key in [key for key in files if key[0] < length]:
+                        files.pop(key).close()
+                    files[length, first] = open(os.path.join(
+                        directory, self.shard_name(length, first)), "wb")
+                    counts[length, first] = 0
+                files[length, first].write(chunk)
+                counts[length, first] += len(chunk) // length
+        finally:
+            for file in files.values():
+                file.close()
+        return counts
+
+
+def read_shard(path, length):
+    """Generates patterns of a shard file as tuples of dot numbers."""
+    with open(path, "rb") as file:
+        while True:
+            chunk = file.read(CHUNK_SIZE * length)
+            if not chunk:
+                break
+            for position in range(0, len(chunk), length):
+                yield tuple(chunk[position:position + length])
@@ -0,0 +1,92 @@
+"""Reading and writing lists of patterns.
+
+Patterns are strings of dots such as "1236". Supported files are:
+
+    .csv    one pattern per row, dots may be separated ("1-2-3-6")
+    .jsonl  one JSON value per line: "1236", [1, 2, 3, 6] or
+            {"pattern": "1236"}
+    .bin    binary pattern file written by PatternStore.save
+"""
+import csv
+import json
+import os
+
+import pattern_engine
+import pattern_store
+
+# File types for file dialogs
+FILE_TYPES = [("CSV", "*.csv"), ("JSON Lines", "*.jsonl"),
+              ("Binary patterns", "*.bin")]
+
+
+def normalize(pattern) -> str:
+    """Turns "1-2-3-6", [1, 2, 3, 6] or ("1", "2", "3", "6") into "1236".
+
+    Anything else (e.g. a number or null in a JSON file) becomes "", which
+    is counted as an invalid pattern.
+    """
+    if isinstance(pattern, (list, tuple)):
+        pattern = "".join(str(dot) for dot in pattern)
+    elif not isinstance(pattern, str):
+        return ""
+    return "".join(c for c in pattern if c not in " -")
+
+
+def read_patterns(path) -> list:
+    """Reads all (not yet validated) patterns from a file.
+
+    :raises ValueError: If the file type is not supported or it's broken
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        with open(path, newline="") as file:
+            try:
+                return [normalize(row[0]) for row in csv.reader(file) if row]
+            except csv.Error as error:  # e.g. a field that is too long
+                raise ValueError(f"Broken CSV file: {error}") from None
+    if extension == ".jsonl":
+        patterns = []
+        with open(path) as file:
+            for line in file:
+                if line.strip():
+                    value = json.loads(line)
+                    if isinstance(value, dict):
+                        value = value.get("pattern", "")
+                    patterns.append(normalize(value))
+        return patterns
+    if extension == ".bin":
+        store = pattern_store.PatternStore.load(path)
+        patterns = ["".join(pattern) for pattern in store]
+        store.close()
+        return patterns
+    raise ValueError("Unsupported file type: " + extension)
+
+
+def write_patterns(path, patterns):
+    """Writes patterns to a file, its type is chosen by the extension.
+
+    :raises ValueError: If the file type is not supported
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        with open(path, "w", newline="") as file:
+            csv.writer(file).writerows([pattern] for pattern in patterns)
+    elif extension == ".jsonl":
+        with open(path, "w") as file:
+            file.writelines(json.dumps(pattern) + "\n" for pattern in patterns)
+    elif extension == ".bin":
+        pattern_store.PatternStore(patterns).save(path)
+    else:
+        raise ValueError("Unsupported file type: " + extension)
+
+
+def valid_patterns(patterns, min_length=4, max_length=9) -> tuple:
+    """Keeps only valid patterns of given lengths, without duplicates.
+
+    :return: Tuple of (list of valid patterns, number of invalid ones)
+    """
+    valid = dict.fromkeys(
+        pattern for pattern, is_valid in zip(
+            patterns, pattern_engine.validate_patterns(patterns))
+        if is_valid and min_length <= len(pattern) <= max_length)
+    return list(valid), sum(1 for pattern in patterns if pattern not in valid)
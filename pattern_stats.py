@@ -0,0 +1,228 @@
+"""Statistics of the whole set of patterns.
+
+For every pattern these metrics are computed once and kept in arrays in
+the order of the patterns:
+
+    segments      number of lines (dots - 1)
+    length        total length of lines in grid units (dots are 1 apart)
+    crossings     number of points where lines cross
+    overlaps      number of pairs of overlapping lines
+    turns         number of direction changes between consecutive lines
+    knight_moves  number of lines that move like a chess knight (1 by 2)
+    complexity    crossings + overlaps + turns + knight_moves
+
+NumPy is used to compute metrics of a PatternStore when it's installed,
+otherwise (or for any other sequence) a pure Python pass is used. It's
+imported on first use by pattern_grid.load_numpy.
+"""
+import collections
+import heapq
+import math
+from array import array
+
+import pattern_geometry
+import pattern_grid
+import pattern_store
+
+METRICS = ("segments", "length", "crossings", "overlaps", "turns",
+           "knight_moves", "complexity")
+
+# Properties of the line with index a * 10 + b (index 0 is no line)
+LENGTHS = [0.0] * 100
+KNIGHT_MOVES = bytearray(100)
+DIRECTIONS = [0] * 100  # direction reduced by gcd, as dx * 10 + dy
+for _a, _b in pattern_geometry.SEGMENTS:
+    _dx = pattern_geometry.POINTS[_b][0] - pattern_geometry.POINTS[_a][0]
+    _dy = pattern_geometry.POINTS[_b][1] - pattern_geometry.POINTS[_a][1]
+    _gcd = math.gcd(_dx, _dy)
+    LENGTHS[_a * 10 + _b] = math.hypot(_dx, _dy)
+    KNIGHT_MOVES[_a * 10 + _b] = {abs(_dx), abs(_dy)} == {1, 2}
+    DIRECTIONS[_a * 10 + _b] = _dx // _gcd * 10 + _dy // _gcd
+del _a, _b, _dx, _dy, _gcd
+
+
+def metrics_step(state, previous_segments, segment) -> tuple:
+    """Adds a line to (crossing bits, overlaps, length, turns, knight moves)
+    of a pattern, see pattern_geometry.fold_lines."""
+    crossings, overlaps, length, turns, knight_moves = state
+    crossings, overlaps = pattern_geometry.add_line(
+        (crossings, overlaps), previous_segments, segment)
+    if previous_segments and DIRECTIONS[previous_segments[-1] // 100] != \
+            DIRECTIONS[segment]:
+        turns += 1
+    return (crossings, overlaps, length + LENGTHS[segment], turns,
+            knight_moves + KNIGHT_MOVES[segment])
+
+
+def python_metrics(patterns) -> dict:
+    """Computes metrics of patterns in one pass, reusing shared prefixes.
+
+    :param patterns: Iterable of patterns, e.g. a PatternStore
+    :return: Dictionary of {metric name: array of values}
+    """
+    metrics = {name: array("B") for name in METRICS}
+    metrics["length"] = array("d")
+    for pattern, state in pattern_geometry.fold_lines(
+            patterns, (0, 0, 0.0, 0, 0), metrics_step):
+        crossings, overlaps, length, turns, knight_moves = state
+        crossing_count = bin(crossings).count("1")
+        metrics["segments"].append(len(pattern) - 1)
+        metrics["length"].append(length)
+        metrics["crossings"].append(crossing_count)
+        metrics["overlaps"].append(overlaps)
+        metrics["turns"].append(turns)
+        metrics["knight_moves"].append(knight_moves)
+        metrics["complexity"].append(
+            crossing_count + overlaps + turns + knight_moves)
+    return metrics
+
+
+def uses_numpy(patterns) -> bool:
+    """Checks if patterns are processed with NumPy: only a PatternStore
+    can be unpacked by dot_table, and only if NumPy is installed."""
+    return isinstance(patterns, pattern_store.PatternStore) and \
+        pattern_grid.load_numpy() is not None
+
+
+def dot_table(store, columns=9):
+    """Unpacks all patterns of a PatternStore into a NumPy table of dots,
+    one row per pattern and 0 after the last dot."""
+    numpy = pattern_grid.load_numpy()
+    dots = numpy.zeros((len(store), columns), numpy.intp)
+    for start, stop, length, data in store.iter_runs():
+        packed = numpy.frombuffer(data, numpy.uint8).reshape(stop - start, -1)
+        nibbles = numpy.empty((stop - start, packed.shape[1] * 2), numpy.intp)
+        nibbles[:, 0::2] = packed >> 4
+        nibbles[:, 1::2] = packed & 15
+        dots[start:stop, :length] = nibbles[:, :length]
+    return dots
+
+
+def numpy_metrics(store) -> dict:
+    """Computes metrics of all patterns of a PatternStore with NumPy.
+
+    Every metric is a few table lookups over whole columns of dot_table.
+
+    :return: Dictionary of {metric name: array of values}
+    """
+    numpy = pattern_grid.load_numpy()
+    dots = dot_table(store)
+
+    # Index of every line, 0 where a pattern has no more lines. Relation
+    # tables are all zeros for pairs with a missing line.
+    present = dots[:, 1:] > 0
+    segments = numpy.where(present, dots[:, :-1] * 10 + dots[:, 1:], 0)
+    tables = pattern_geometry.relation_tables()
+    crossing_bits = numpy.array(tables.crossing_bits, numpy.uint32)
+    overlap_table = numpy.frombuffer(tables.overlaps, numpy.uint8)
+    crossings = numpy.zeros(len(store), numpy.uint32)
+    overlaps = numpy.zeros(len(store), numpy.uint8)
+    for j in range(1, segments.shape[1]):
+        for i in range(j):
+            pairs = segments[:, i] * 100 + segments[:, j]
+            crossings |= crossing_bits[pairs]
+            overlaps += overlap_table[pairs]
+    crossings = numpy.unpackbits(crossings.view(numpy.uint8)).reshape(
+        len(store), -1).sum(axis=1, dtype=numpy.uint8)
+
+    directions = numpy.array(DIRECTIONS)[segments]
+    turns = ((directions[:, 1:] != directions[:, :-1]) &
+             present[:, 1:]).sum(axis=1, dtype=numpy.uint8)
+    knight_moves = numpy.frombuffer(KNIGHT_MOVES, numpy.uint8)[
+        segments].sum(axis=1, dtype=numpy.uint8)
+    values = {
+        "segments": present.sum(axis=1, dtype=numpy.uint8),
+        "length": numpy.array(LENGTHS)[segments].sum(axis=1),
+        "crossings": crossings,
+        "overlaps": overlaps,
+        "turns": turns,
+        "knight_moves": knight_moves,
+        "complexity": crossings + overlaps + turns + knight_moves,
+    }
+
+    metrics = {}
+    for name, column in values.items():
+        metrics[name] = array("d" if name == "length" else "B")
+        metrics[name].frombytes(column.astype(
+            numpy.float64 if name == "length" else numpy.uint8).tobytes())
+    return metrics
+
+
+class PatternStatistics:
+
+    def __init__(self, patterns):
+        """Metrics of every pattern, computed once and cached.
+
+        :param patterns: Sequence of patterns, e.g. a PatternStore
+        """
+        self.patterns = patterns
+        if uses_numpy(patterns):
+            self.metrics = numpy_metrics(patterns)
+        else:
+            self.metrics = python_metrics(patterns)
+        self.cache = {}  # (query, arguments): result
+
+    def __len__(self):
+        return len(self.metrics["segments"])
+
+    def add_metric(self, name, values):
+        """Adds values of another metric, one for each pattern."""
+        self.metrics[name] = values
+
+    def indices(self, length=None):
+        """Returns indices of all patterns, or of patterns with given
+        number of dots."""
+        if length is None:
+            return range(len(self))
+        segments = self.metrics["segments"]
+        return [i for i in range(len(self)) if segments[i] == length - 1]
+
+    def histogram(self, metric, length=None) -> dict:
+        """Counts patterns by the value of a metric.
+
+        :param metric: One of METRICS, lengths are rounded to 2 decimals
+        :param length: Only count patterns with this number of dots
+        :return: Dictionary of {value: number of patterns}, sorted by value
+        """
+        key = ("histogram", metric, length)
+        if key not in self.cache:
+            values = self.metrics[metric]
+            if metric == "length":
+                values = [round(value, 2) for value in values]
+            counter = collections.Counter(
+                values if length is None else
+                [values[i] for i in self.indices(length)])
+            self.cache[key] = dict(sorted(counter.items()))
+        return self.cache[key]
+
+    def top(self, metric, n=10, length=None, lowest=False) -> list:
+        """Finds patterns with the highest values of a metric, e.g. the
+        most complex patterns of 9 dots.
+
+        :param metric: One of METRICS
+        :param n: Number of patterns to return
+        :param length: Only consider patterns with this number of dots
+        :param lowest: If True, patterns with the lowest values are found
+        :return: List of (pattern, value), highest (or lowest) first
+        """
+        key = ("top", metric, n, length, lowest)
+        if key not in self.cache:
+            values = self.metrics[metric]
+            find = heapq.nsmallest if lowest else heapq.nlargest
+            self.cache[key] = [
+                (self.patterns[i], values[i]) for i in find(
+                    n, self.indices(length), key=values.__getitem__)]
+        return self.cache[key]
+
+    def summary(self, metric, length=None) -> tuple:
+        """Returns (minimum, mean, maximum) of a metric.
+
+        :raises ValueError: If there are no patterns (of given length)
+        """
+        values = self.metrics[metric]
+        if length is not None:
+            values = [values[i] for i in self.indices(length)]
+        if not values:
+            raise ValueError("No patterns" + (
+                "" if length is None else f" with {length} dots"))
+        return min(values), sum(values) / len(values), max(values)
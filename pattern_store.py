@@ -0,0 +1,268 @@
+"""Compact storage for large collections of patterns.
+
+Every dot takes 4 bits: a pattern such as ("1", "2", "3", "6") is stored
+as the bytes 0x12 0x36, so its hex form is the pattern itself. Patterns
+of odd length are padded with a 0 nibble.
+
+A store can be saved to a versioned binary file and mapped back into
+memory with mmap, which makes loading it almost free:
+
+    header  magic, version, number of runs and patterns, CRC-32 and size
+            of the data
+    runs    (first index, pattern length, byte offset) for every run
+    data    packed patterns
+"""
+import bisect
+import mmap
+import os
+import struct
+import threading
+import zlib
+
+FILE_MAGIC = b"AUPS"
+FILE_VERSION = 1
+_HEADER = struct.Struct("<4sHHIII")
+_RUN = struct.Struct("<III")
+
+
+class PatternStore:
+
+    def __init__(self, patterns=()):
+        """Sequence of patterns packed into a single bytes buffer.
+
+        Consecutive patterns of the same length form a run, and runs are
+        kept in a small index of (first index, pattern length, byte offset),
+        so indexing, slicing, reversing and len() are all O(1).
+        Items are returned as tuples of strings, e.g. ("1", "2", "3", "6").
+        """
+        self._lock = threading.Lock()  # only one thread can extend at once
+        self._data = bytearray()
+        self._run_starts = []  # index of the first pattern of each run
+        self._run_lengths = []  # number of dots of patterns in each run
+        self._run_offsets = []  # position of each run in the buffer
+        self._size = 0
+        self.extend(patterns)
+
+    def extend(self, patterns):
+        """Packs and appends patterns at the end of the store.
+
+        New patterns are published all at once when they are written, so
+        other threads can keep reading the store while it's being extended.
+        """
+        with self._lock:
+            data = self._data
+            size = self._size
+            for pattern in patterns:
+                length = len(pattern)
+                if not self._run_lengths or self._run_lengths[-1] != length:
+                    self._run_starts.append(size)
+                    self._run_lengths.append(length)
+                    self._run_offsets.append(len(data))
+                dots = "".join(pattern)
+                data += bytes.fromhex(dots + "0" if length % 2 else dots)
+                size += 1
+            self._size = size
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PatternView(self, range(self._size)[index])
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("pattern index out of range")
+        run = bisect.bisect_right(self._run_starts, index) - 1
+        length = self._run_lengths[run]
+        size = (length + 1) // 2
+        position = self._run_offsets[run] + (
+                index - self._run_starts[run]) * size
+        return tuple(self._data[position:position + size].hex()[:length])
+
+    def __iter__(self):
+        data = self._data
+        for run, (start, length, offset) in enumerate(zip(
+                self._run_starts, self._run_lengths, self._run_offsets)):
+            stop = self._run_starts[run + 1] if run + 1 < len(
+                self._run_starts) else self._size
+            size = (length + 1) // 2
+            for position in range(offset, offset + (stop - start) * size,
+                                  size):
+                yield tuple(data[position:position + size].hex()[:length])
+
+    def __reversed__(self):
+        return iter(self[::-1])
+
+    def nbytes(self) -> int:
+        """Returns memory used by packed patterns and the run index."""
+        return len(self._data) + 3 * 8 * len(self._run_starts)
+
+    def iter_runs(self):
+        """Yields (first index, stop index, pattern length, packed data)
+        of every run of patterns with the same length."""
+        stops = self._run_starts[1:] + [self._size]
+        for start, stop, length, offset in zip(
+                self._run_starts, stops, self._run_lengths, self._run_offsets):
+            size = (length + 1) // 2
+            yield start, stop, length, self._data[
+                offset:offset + (stop - start) * size]
+
+    def store_ranges(self, start, stop) -> list:
+        """Returns store indices of patterns start to stop as ranges."""
+        return [range(start, stop)] if start < stop else []
+
+    def select_lengths(self, lengths):
+        """Returns a lazy view of all patterns with one of given lengths.
+
+        Only the run index is scanned, so selecting costs nothing no matter
+        how many patterns are selected.
+        """
+        stops = self._run_starts[1:] + [self._size]
+        return PatternView(self, [
+            range(start, stop) for start, stop, length in zip(
+                self._run_starts, stops, self._run_lengths)
+            if length in lengths])
+
+    def count_by_length(self) -> dict:
+        """Returns a dictionary of {pattern length: number of patterns}."""
+        counts = {}
+        stops = self._run_starts[1:] + [self._size]
+        for start, stop, length in zip(self._run_starts, stops,
+                                       self._run_lengths):
+            counts[length] = counts.get(length, 0) + stop - start
+        return counts
+
+    def save(self, path):
+        """Writes the store to a binary pattern file.
+
+        The file is written next to its destination first and then moved,
+        so an interrupted save never leaves a broken file behind.
+        """
+        runs = b"".join(_RUN.pack(*run) for run in zip(
+            self._run_starts, self._run_lengths, self._run_offsets))
+        header = _HEADER.pack(FILE_MAGIC, FILE_VERSION,
+                              len(self._run_starts), self._size,
+                              zlib.crc32(self._data), len(self._data))
+        with open(path + ".tmp", "wb") as file:
+            file.write(header + runs)
+            file.write(self._data)
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def load(cls, path):
+        """Maps a binary pattern file into memory.
+
+        The returned store is read-only, patterns are paged in on access.
+
+        :raises OSError: If the file can't be opened
+        :raises ValueError: If the file is stale (other version) or broken
+        """
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size < _HEADER.size:
+                raise ValueError("Pattern file is too short")
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, runs, count, checksum, size = _HEADER.unpack_from(data)
+        data_start = _HEADER.size + runs * _RUN.size
+        if magic != FILE_MAGIC or version != FILE_VERSION:
+            data.close()
+            raise ValueError("Unknown pattern file version")
+        if len(data) != data_start + size or zlib.crc32(
+                data[data_start:]) != checksum:
+            data.close()
+            raise ValueError("Pattern file checksum does not match")
+
+        store = cls()
+        store._data = memoryview(data)[data_start:]
+        store._size = count
+        for run in range(runs):
+            start, length, offset = _RUN.unpack_from(
+                data, _HEADER.size + run * _RUN.size)
+            store._run_starts.append(start)
+            store._run_lengths.append(length)
+            store._run_offsets.append(offset)
+        return store
+
+    def close(self):
+        """Unmaps the pattern file of a loaded store."""
+        if isinstance(self._data, memoryview):
+            data = self._data.obj
+            self._data.release()
+            data.close()
+
+
+class PatternView:
+
+    def __init__(self, store, indices):
+        """Lazy slice, selection or reversed order of a PatternStore.
+
+        :param store: PatternStore (or another view) that holds the patterns
+        :param indices: range of store indices that this view shows, or a
+        list of ranges that are shown one after another
+        """
+        self.store = store
+        if isinstance(indices, range):
+            indices = [indices]
+        self.ranges = [indices_range for indices_range in indices
+                       if indices_range]
+        self._starts = []  # view index of the first pattern of each range
+        self._size = 0
+        for indices_range in self.ranges:
+            self._starts.append(self._size)
+            self._size += len(indices_range)
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            if index == slice(None, None, -1):
+                return PatternView(self.store, [
+                    indices_range[::-1]
+                    for indices_range in reversed(self.ranges)])
+            if len(self.ranges) == 1:
+                return PatternView(self.store, self.ranges[0][index])
+            return PatternView(self, range(self._size)[index])
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("pattern index out of range")
+        part = bisect.bisect_right(self._starts, index) - 1
+        return self.store[self.ranges[part][index - self._starts[part]]]
+
+    def __iter__(self):
+        store = self.store
+        for indices_range in self.ranges:
+            for index in indices_range:
+                yield store[index]
+
+    def __reversed__(self):
+        return iter(self[::-1])
+
+    def store_ranges(self, start, stop) -> list:
+        """Returns indices of patterns start to stop of this view in the
+        PatternStore as ascending ranges, e.g. to sum their metrics.
+
+        Ranges cover the same patterns, but not in the order of the view.
+        """
+        found = []
+        part = max(bisect.bisect_right(self._starts, start) - 1, 0)
+        for part in range(part, len(self.ranges)):
+            offset = self._starts[part]
+            if offset >= stop:
+                break
+            indices = self.ranges[part][max(start - offset, 0):stop - offset]
+            if not indices:
+                continue
+            if abs(indices.step) == 1:
+                parts = [range(min(indices), max(indices) + 1)]
+            else:
+                parts = [range(index, index + 1) for index in indices]
+            if isinstance(self.store, PatternView):
+                for indices in parts:
+                    found.extend(self.store.store_ranges(indices.start,
+                                                         indices.stop))
+            else:
+                found.extend(parts)
+        return found
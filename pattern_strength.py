@@ -0,0 +1,165 @@
+"""Strength of patterns, scored by how guessable they are.
+
+A Markov model of dot transitions is built from the set of all patterns:
+the probability of the next dot depends on the previous ORDER dots. Every
+pattern starts after ORDER "^" symbols and ends with a "$" symbol, so the
+model also knows how likely each first dot and each pattern length is.
+
+The score of a pattern is its surprisal in bits, -log2 P(pattern). Common
+moves (e.g. to a neighbouring dot) are cheap, rare ones are expensive, so
+a higher score means a pattern that is harder to guess.
+"""
+import collections
+import functools
+import math
+from array import array
+
+import pattern_grid
+import pattern_stats
+
+ORDER = 2  # number of previous dots the next dot depends on
+START, END = "^", "$"
+
+# Weak patterns are below the first limit, strong ones above the second.
+# About 10% of all patterns are weak and 30% are strong.
+STRENGTH_LIMITS = (22.0, 28.0)
+# Names of symbols with codes used by NumPy: 0 for the end (and after it),
+# 1-9 for dots and 10 for the start
+SYMBOL_CODES = END + "123456789" + START
+
+
+class StrengthModel:
+
+    def __init__(self, patterns):
+        """Counts all transitions of patterns, each pattern once.
+
+        :param patterns: Iterable of patterns, e.g. a PatternStore
+        """
+        if pattern_stats.uses_numpy(patterns):
+            counts = self.numpy_counts(patterns)
+        else:
+            counts = collections.Counter()
+            for pattern in patterns:
+                symbols = START * ORDER + "".join(pattern) + END
+                for i in range(len(symbols) - ORDER):
+                    counts[symbols[i:i + ORDER + 1]] += 1
+
+        # Transition (context + symbol): bits needed to encode the symbol
+        context_counts = collections.Counter()
+        for transition, count in counts.items():
+            context_counts[transition[:-1]] += count
+        self.bits = {transition: -math.log2(count / context_counts[
+            transition[:-1]]) for transition, count in counts.items()}
+        # Transitions that never happen cost as much as a random symbol
+        self.unseen_bits = math.log2(10)
+        self.prefix_bits = functools.lru_cache(maxsize=65536)(
+            self.calculate_prefix_bits)
+
+    @staticmethod
+    def numpy_counts(store) -> collections.Counter:
+        """Counts transitions of all patterns of a PatternStore with NumPy."""
+        numpy = pattern_grid.load_numpy()
+        totals = numpy.zeros(11 ** (ORDER + 1), numpy.intp)
+        for codes, used in StrengthModel.numpy_transitions(store):
+            totals += numpy.bincount(codes[used], minlength=len(totals))
+        return collections.Counter({
+            StrengthModel.transition_name(code): int(totals[code])
+            for code in numpy.flatnonzero(totals)})
+
+    @staticmethod
+    def numpy_transitions(store):
+        """Yields (codes of transitions, mask of real transitions) for every
+        position of patterns of a PatternStore, columns of a NumPy table."""
+        numpy = pattern_grid.load_numpy()
+        dots = pattern_stats.dot_table(store, columns=10)
+        symbols = numpy.hstack([numpy.full((len(store), ORDER), 10), dots])
+        for i in range(ORDER, symbols.shape[1]):
+            # Nothing follows the end
+            yield sum(symbols[:, i - k] * 11 ** k for k in range(ORDER + 1)), \
+                symbols[:, i - 1] != 0
+
+    @staticmethod
+    def transition_name(code) -> str:
+        """Turns a NumPy code of a transition into its name, e.g. "^12"."""
+        return "".join(SYMBOL_CODES[code // 11 ** k % 11]
+                       for k in reversed(range(ORDER + 1)))
+
+    def transition_bits(self, context, symbol) -> float:
+        """Returns bits of a symbol following a context of ORDER symbols."""
+        return self.bits.get(context + symbol, self.unseen_bits)
+
+    def calculate_prefix_bits(self, prefix) -> float:
+        """Returns bits of the beginning of a pattern (string of dots).
+
+        Called through the cached prefix_bits, so patterns that share a
+        prefix (e.g. every pattern starting with "123") only score it once.
+        """
+        if not prefix:
+            return 0.0
+        symbols = START * ORDER + prefix
+        return self.prefix_bits(prefix[:-1]) + self.transition_bits(
+            symbols[-ORDER - 1:-1], symbols[-1])
+
+    def score(self, pattern) -> float:
+        """Returns the score of a pattern in bits.
+
+        :param pattern: Sequence of dots, e.g. "1236" or ("1", "2", "3", "6")
+        """
+        pattern = "".join(pattern)
+        symbols = START * ORDER + pattern
+        return self.prefix_bits(pattern) + self.transition_bits(
+            symbols[-ORDER:], END)
+
+    def score_patterns(self, patterns) -> array:
+        """Scores patterns in one pass, like pattern_stats.python_metrics.
+
+        :param patterns: Iterable of patterns, e.g. a PatternStore
+        :return: Array of scores in bits
+        """
+        if pattern_stats.uses_numpy(patterns):
+            return self.numpy_scores(patterns)
+        scores = array("d")
+        bits = self.bits
+        unseen_bits = self.unseen_bits
+        previous_symbols = ""
+        prefix_bits = [0.0]  # bits of the previous pattern's dots up to i
+        for pattern in patterns:
+            symbols = START * ORDER + "".join(pattern)
+            # Keep bits of dots shared with the previous pattern
+            shared = 0
+            for old, new in zip(previous_symbols[ORDER:], symbols[ORDER:]):
+                if old != new:
+                    break
+                shared += 1
+            del prefix_bits[shared + 1:]
+
+            total = prefix_bits[-1]
+            for i in range(ORDER + shared, len(symbols)):
+                total += bits.get(symbols[i - ORDER:i + 1], unseen_bits)
+                prefix_bits.append(total)
+            scores.append(total + bits.get(symbols[-ORDER:] + END,
+                                           unseen_bits))
+            previous_symbols = symbols
+        return scores
+
+    def numpy_scores(self, store) -> array:
+        """Scores all patterns of a PatternStore with NumPy."""
+        numpy = pattern_grid.load_numpy()
+        table = numpy.array([
+            self.bits.get(self.transition_name(code), self.unseen_bits)
+            for code in range(11 ** (ORDER + 1))])
+        totals = numpy.zeros(len(store))
+        for codes, used in self.numpy_transitions(store):
+            totals += numpy.where(used, table[codes], 0.0)
+        scores = array("d")
+        scores.frombytes(totals.tobytes())
+        return scores
+
+
+def strength(score) -> str:
+    """Describes a score in bits as "weak", "medium" or "strong"."""
+    if score < STRENGTH_LIMITS[0]:
+        return "weak"
+    if score < STRENGTH_LIMITS[1]:
+        return "medium"
+    return "strong"
@@ -0,0 +1,314 @@
+"""Checks of the pattern engines against brute force on small grids.
+
+Every permutation of dots is checked with the plain rule: a line may only
+pass over a dot that was already visited. Run with:
+
+    python -m unittest test_patterns
+"""
+import itertools
+import math
+import os
+import struct
+import tempfile
+import unittest
+
+import pattern_engine
+import pattern_filter
+import pattern_grid
+import pattern_stats
+import pattern_store
+
+# Longest patterns that are enumerated by brute force, so that a 3x3 grid
+# takes seconds; longer lengths are checked against the known total
+MAX_BRUTE_LENGTH = 6
+
+
+def brute_force_patterns(columns, rows, max_length):
+    """Returns all valid patterns of 1 to max_length dots of a grid, ordered
+    by length and then lexicographically, as tuples of dot numbers."""
+    def is_valid(pattern):
+        for i in range(1, len(pattern)):
+            (xa, ya), (xb, yb) = (divmod(pattern[i - 1] - 1, columns)[::-1],
+                                  divmod(pattern[i] - 1, columns)[::-1])
+            steps = math.gcd(xb - xa, yb - ya)
+            for step in range(1, steps):
+                x = xa + (xb - xa) // steps * step
+                y = ya + (yb - ya) // steps * step
+                if y * columns + x + 1 not in pattern[:i]:
+                    return False
+        return True
+
+    dots = range(1, columns * rows + 1)
+    return [pattern for length in range(1, max_length + 1)
+            for pattern in itertools.permutations(dots, length)
+            if is_valid(pattern)]
+
+
+def count_by_length(patterns) -> dict:
+    counts = {}
+    for pattern in patterns:
+        counts[len(pattern)] = counts.get(len(pattern), 0) + 1
+    return counts
+
+
+class GridTest(unittest.TestCase):
+
+    GRIDS = ((2, 3), (3, 2), (3, 3))
+
+    def brute_force(self, grid):
+        max_length = min(grid.size, MAX_BRUTE_LENGTH)
+        return max_length, brute_force_patterns(grid.columns, grid.rows,
+                                                max_length)
+
+    def test_is_valid_pattern(self):
+        for columns, rows in self.GRIDS:
+            grid = pattern_grid.Grid(columns, rows)
+            max_length, patterns = self.brute_force(grid)
+            valid = set(patterns)
+            for length in range(1, max_length + 1):
+                for pattern in itertools.permutations(grid.dots, length):
+                    self.assertEqual(grid.is_valid_pattern(pattern),
+                                     pattern in valid, (grid, pattern))
+
+    def test_iter_patterns(self):
+        for columns, rows in self.GRIDS:
+            grid = pattern_grid.Grid(columns, rows)
+            max_length, patterns = self.brute_force(grid)
+            generated = list(grid.iter_patterns(1, max_length))
+            self.assertEqual(len(generated), len(patterns), grid)
+            self.assertEqual(set(generated), set(patterns), grid)
+
+    def test_iter_pattern_chunks(self):
+        for columns, rows in self.GRIDS:
+            grid = pattern_grid.Grid(columns, rows)
+            max_length, patterns = self.brute_force(grid)
+            generated = []
+            # A tiny chunk size makes sure patterns span several chunks
+            for length, first, chunk in grid.iter_pattern_chunks(
+                    1, max_length, chunk_size=5):
+                self.assertEqual(len(chunk) % length, 0)
+                for position in range(0, len(chunk), length):
+                    pattern = tuple(chunk[position:position + length])
+                    self.assertEqual(pattern[0], first)
+                    generated.append(pattern)
+            self.assertEqual(sorted(generated), sorted(patterns), grid)
+
+    def test_first_dots(self):
+        grid = pattern_grid.Grid(3, 3)
+        _max_length, patterns = self.brute_force(grid)
+        expected = {pattern for pattern in patterns
+                    if len(pattern) >= 4 and pattern[0] in (2, 5)}
+        self.assertEqual(set(grid.iter_patterns(4, MAX_BRUTE_LENGTH, (2, 5))),
+                         expected)
+
+    def test_counts(self):
+        for columns, rows in self.GRIDS:
+            grid = pattern_grid.Grid(columns, rows)
+            max_length, patterns = self.brute_force(grid)
+            expected = [0] + [count_by_length(patterns)[length]
+                              for length in range(1, max_length + 1)]
+            self.assertEqual(grid.python_counts(max_length), expected, grid)
+            if pattern_grid.load_numpy() is not None:
+                self.assertEqual(grid.numpy_counts(max_length), expected,
+                                 grid)
+            self.assertEqual(grid.count_patterns(1, max_length),
+                             dict(enumerate(expected[1:], 1)), grid)
+
+    def test_counts_of_all_lengths(self):
+        # 2x3 is small enough to enumerate every length
+        grid = pattern_grid.Grid(2, 3)
+        patterns = brute_force_patterns(2, 3, grid.size)
+        self.assertEqual(grid.count_patterns(1), count_by_length(patterns))
+        # Known total of the android grid
+        self.assertEqual(sum(pattern_grid.Grid().count_patterns().values()),
+                         389112)
+
+    def test_filtered_counts(self):
+        grid = pattern_grid.Grid(3, 3)
+        _max_length, patterns = self.brute_force(grid)
+        for start, end, include in ((1, None, ()), (None, 9, ()),
+                                    (None, None, (5,)), (2, 8, (4, 6))):
+            required = 0
+            for dot in include:
+                required |= grid.bit(dot)
+            expected = [0] * (MAX_BRUTE_LENGTH + 1)
+            for pattern in patterns:
+                if (start is None or pattern[0] == start) and \
+                        (end is None or pattern[-1] == end) and \
+                        set(include) <= set(pattern):
+                    expected[len(pattern)] += 1
+            self.assertEqual(grid.python_counts(MAX_BRUTE_LENGTH, start, end,
+                                                required), expected)
+
+    def test_write_shards(self):
+        grid = pattern_grid.Grid(2, 3)
+        patterns = brute_force_patterns(2, 3, 4)
+        with tempfile.TemporaryDirectory() as directory:
+            counts = grid.write_shards(directory, 2, 4, chunk_size=7)
+            read = []
+            for (length, first), count in counts.items():
+                shard = list(pattern_grid.read_shard(os.path.join(
+                    directory, grid.shard_name(length, first)), length))
+                self.assertEqual(len(shard), count)
+                read.extend(tuple(pattern) for pattern in shard)
+        self.assertEqual(sorted(read), sorted(pattern for pattern in patterns
+                                              if len(pattern) >= 2))
+
+    def test_invalid_lengths(self):
+        grid = pattern_grid.Grid(2, 3)
+        with self.assertRaises(ValueError):
+            grid.count_patterns(0, 4)
+        with self.assertRaises(ValueError):
+            grid.count_patterns(5, 4)
+
+
+class EngineTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.patterns = [
+            tuple(str(dot) for dot in pattern)
+            for pattern in brute_force_patterns(3, 3, MAX_BRUTE_LENGTH)]
+
+    def test_generate_patterns(self):
+        # Same order as the baseline: by length, then lexicographically
+        self.assertEqual(
+            list(pattern_engine.generate_patterns(1, MAX_BRUTE_LENGTH)),
+            self.patterns)
+
+    def test_validation(self):
+        valid = set(self.patterns)
+        candidates = [pattern for length in range(1, MAX_BRUTE_LENGTH + 1)
+                      for pattern in itertools.permutations(
+                          pattern_engine.DOTS, length)]
+        results = pattern_engine.validate_patterns(candidates)
+        for candidate, result in zip(candidates, results):
+            self.assertEqual(bool(result), candidate in valid, candidate)
+            self.assertEqual(pattern_engine.is_valid_pattern(candidate),
+                             candidate in valid, candidate)
+        for candidate in ((), "", "1231", "0123", ("1", "x"), [1, 2, 3]):
+            self.assertEqual(
+                pattern_engine.is_valid_pattern(candidate),
+                bool(pattern_engine.validate_patterns([candidate])[0]),
+                candidate)
+
+    def test_count_patterns(self):
+        for start, end, include in ((None, None, ()), ("1", None, ()),
+                                    (None, "5", ()), (None, None, ("2",)),
+                                    ("4", "6", ("5", "1"))):
+            expected = {length: 0 for length in range(4, MAX_BRUTE_LENGTH + 1)}
+            for pattern in self.patterns:
+                if len(pattern) >= 4 and \
+                        (start is None or pattern[0] == start) and \
+                        (end is None or pattern[-1] == end) and \
+                        set(include) <= set(pattern):
+                    expected[len(pattern)] += 1
+            self.assertEqual(pattern_engine.count_patterns(
+                4, MAX_BRUTE_LENGTH, start, end, include), expected)
+        with self.assertRaises(ValueError):
+            pattern_engine.count_patterns(5, 4)
+        with self.assertRaises(ValueError):
+            pattern_engine.count_patterns(start="0")
+
+
+class PatternStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.patterns = list(pattern_engine.generate_patterns(1, 5))
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "patterns.bin")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_sequence(self):
+        store = pattern_store.PatternStore(self.patterns)
+        self.assertEqual(len(store), len(self.patterns))
+        self.assertEqual(list(store), self.patterns)
+        self.assertEqual(list(reversed(store)), self.patterns[::-1])
+        self.assertEqual(store[-1], self.patterns[-1])
+        self.assertEqual(list(store[10:200:7]), self.patterns[10:200:7])
+        self.assertEqual(store.count_by_length(),
+                         count_by_length(self.patterns))
+
+    def test_save_and_load(self):
+        pattern_store.PatternStore(self.patterns).save(self.path)
+        store = pattern_store.PatternStore.load(self.path)
+        try:
+            self.assertEqual(list(store), self.patterns)
+            self.assertEqual(store[1234], self.patterns[1234])
+            self.assertEqual(store.count_by_length(),
+                             count_by_length(self.patterns))
+        finally:
+            store.close()
+
+    def test_corrupt_files(self):
+        pattern_store.PatternStore(self.patterns).save(self.path)
+        with open(self.path, "rb") as file:
+            data = file.read()
+        version = struct.pack("<H", pattern_store.FILE_VERSION + 1)
+        flipped = bytearray(data)
+        flipped[-1] ^= 0xFF
+        for broken in (data[:10], data[:-1], data + b"\0",
+                       data[:4] + version + data[6:], b"XXXX" + data[4:],
+                       bytes(flipped)):
+            with open(self.path, "wb") as file:
+                file.write(broken)
+            with self.assertRaises(ValueError):
+                pattern_store.PatternStore.load(self.path).close()
+
+
+class PatternIndexTest(unittest.TestCase):
+
+    QUERIES = ("starts-with:1", "ends-with:5", "contains-dot:5",
+               "not contains-dot:5", "contains-segment:3-1",
+               "no-knight-moves", "length:5-6",
+               "starts-with:2 not ends-with:8 contains-segment:4-5",
+               "not no-knight-moves length:4")
+
+    def matches(self, pattern, query):
+        """Evaluates a query on a single pattern."""
+        segments = {frozenset(line) for line in zip(pattern, pattern[1:])}
+        knight_moves = any(
+            {abs((int(a) - 1) % 3 - (int(b) - 1) % 3),
+             abs((int(a) - 1) // 3 - (int(b) - 1) // 3)} == {1, 2}
+            for a, b in zip(pattern, pattern[1:]))
+        result = True
+        for negated, predicate, argument in pattern_filter.parse_filter(query):
+            if predicate == "starts-with":
+                met = pattern[0] == argument
+            elif predicate == "ends-with":
+                met = pattern[-1] == argument
+            elif predicate == "contains-dot":
+                met = argument in pattern
+            elif predicate == "contains-segment":
+                met = frozenset(argument) in segments
+            elif predicate == "no-knight-moves":
+                met = not knight_moves
+            else:
+                met = len(pattern) in argument
+            result = result and met != negated
+        return result
+
+    def check(self, patterns):
+        index = pattern_filter.PatternIndex(
+            patterns, pattern_stats.PatternStatistics(patterns))
+        for query in self.QUERIES:
+            expected = [pattern for pattern in patterns
+                        if self.matches(pattern, query)]
+            self.assertEqual(list(index.select(query)), expected, query)
+        expected = [pattern for pattern in patterns if pattern[0] == "3" and
+                    len(pattern) == 6]
+        self.assertEqual(list(index.select("starts-with:3", [6])), expected)
+
+    def test_python_flags(self):
+        self.check(list(pattern_engine.generate_patterns(4, 6)))
+
+    @unittest.skipIf(pattern_grid.load_numpy() is None, "needs NumPy")
+    def test_numpy_flags(self):
+        self.check(pattern_store.PatternStore(
+            pattern_engine.generate_patterns(4, 6)))
+
+
+if __name__ == "__main__":
+    unittest.main()